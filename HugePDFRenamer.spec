@@ -40,10 +40,6 @@ a = Analysis(
         'pdfminer.pdfinterp',
         'pdfminer.converter',
         'pdfminer.layout',
-        # 其他依赖
-        'keyboard',
-        'tqdm',
-        'sv_ttk',
         # 项目模块
         'main',
         'main.pdf_renamer',
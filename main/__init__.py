@@ -13,6 +13,7 @@ Licensed under the MIT License.
     - config: 配置管理
     - file_processor: 文件处理核心
     - smart_text_extractor: PDF 标题提取
+    - title_cache: 标题提取结果缓存
     - utils: 通用工具
 """
 
@@ -29,8 +30,21 @@ __license__ = "MIT"
 from .config import RenameConfig, ConfigManager, config_manager
 from .file_processor import FileProcessor, RenameResult, ProcessStats
 from .smart_text_extractor import SmartTextExtractor, ExtractedText
+from .title_cache import TitleCache
 from .utils import setup_logging
-from .pdf_renamer import MainApp, main
+
+
+def __getattr__(name: str):
+    """按需导入 GUI 入口。
+
+    GUI 模块会导入 customtkinter/tkinter，只在访问 MainApp 或 main 时才
+    加载。只使用处理逻辑的场景（如并行提取的工作进程）不必付出这部分开销。
+    """
+    if name in ("MainApp", "main"):
+        from . import pdf_renamer
+
+        return getattr(pdf_renamer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # 版本信息
@@ -49,6 +63,7 @@ __all__ = [
     # 文本提取
     "SmartTextExtractor",
     "ExtractedText",
+    "TitleCache",
     # 工具
     "setup_logging",
     # GUI
@@ -13,10 +13,11 @@ Version: 1.0.0
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
-from typing import Any, Set
+from typing import Any, FrozenSet, Optional
+
+from .utils import json_dumps, json_loads
 
 # 配置文件名
 CONFIG_FILENAME = "config.json"
@@ -37,15 +38,20 @@ class RenameConfig:
         max_filename_length: 最大文件名长度，范围 10-255，默认 120
         add_timestamp: 是否添加时间戳后缀，默认 False
         auto_backup: 是否自动备份原文件，默认 False
+        backup_use_hardlink: 备份时使用硬链接代替复制，默认 False。硬链接与
+            原文件共享数据，原文件被原地修改时备份也会随之改变
         parallel_processing: 是否启用并行处理，默认 True
-        max_workers: 最大并行工作线程数，范围 1-16，默认 4
+        recursive_scan: 选择文件夹时是否包含子文件夹，默认 False
+        max_workers: 最大并行工作进程数，范围 1-16，默认 4
         language: 界面语言，默认 zh_CN（简体中文）
     """
 
     max_filename_length: int = 120
     add_timestamp: bool = False
     auto_backup: bool = False
+    backup_use_hardlink: bool = False
     parallel_processing: bool = True
+    recursive_scan: bool = False
     max_workers: int = 4
     language: str = DEFAULT_LANGUAGE
 
@@ -67,6 +73,40 @@ class RenameConfig:
             self.language = DEFAULT_LANGUAGE
 
 
+# RenameConfig 的字段名集合，加载配置时用于过滤未知字段
+CONFIG_FIELDS: FrozenSet[str] = frozenset(f.name for f in fields(RenameConfig))
+
+
+def _dump_config(config: RenameConfig) -> bytes:
+    """将配置序列化为 JSON 字节串。
+
+    Args:
+        config: 配置实例
+
+    Returns:
+        bytes: UTF-8 编码的 JSON
+    """
+    return json_dumps(asdict(config))
+
+
+def _load_config_data(data: bytes) -> RenameConfig:
+    """从 JSON 字节串解析配置，只使用已知字段，忽略未知字段。
+
+    Args:
+        data: UTF-8 编码的 JSON
+
+    Returns:
+        RenameConfig: 解析出的配置实例
+
+    Raises:
+        TypeError: 字段值类型不匹配
+        ValueError: JSON 格式错误
+    """
+    values = json_loads(data)
+    filtered_data = {k: v for k, v in values.items() if k in CONFIG_FIELDS}
+    return RenameConfig(**filtered_data)
+
+
 class ConfigManager:
     """配置管理器。
 
@@ -82,11 +122,21 @@ class ConfigManager:
         True
     """
 
-    def __init__(self) -> None:
-        """初始化配置管理器，加载配置文件。"""
-        base_dir = Path(__file__).resolve().parent.parent
-        self.config_file = base_dir / CONFIG_FILENAME
-        self.config = self._load_config()
+    def __init__(
+        self,
+        config_file: Optional[Path] = None,
+        config: Optional[RenameConfig] = None,
+    ) -> None:
+        """初始化配置管理器，加载配置文件。
+
+        Args:
+            config_file: 配置文件路径，默认为项目根目录下的 config.json
+            config: 初始配置，为 None 时从配置文件加载
+        """
+        if config_file is None:
+            config_file = Path(__file__).resolve().parent.parent / CONFIG_FILENAME
+        self.config_file = config_file
+        self.config = config if config is not None else self._load_config()
 
     def _load_config(self) -> RenameConfig:
         """从文件加载配置。
@@ -100,15 +150,9 @@ class ConfigManager:
             return RenameConfig()
 
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # 只使用已知字段，忽略未知字段
-            known_fields: Set[str] = {
-                f.name for f in RenameConfig.__dataclass_fields__.values()
-            }
-            filtered_data = {k: v for k, v in data.items() if k in known_fields}
-            return RenameConfig(**filtered_data)
-        except (json.JSONDecodeError, TypeError, ValueError):
+            with open(self.config_file, "rb") as f:
+                return _load_config_data(f.read())
+        except (TypeError, ValueError):
             return RenameConfig()
 
     def save_config(self) -> bool:
@@ -118,14 +162,14 @@ class ConfigManager:
             bool: 保存是否成功
         """
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(asdict(self.config), f, ensure_ascii=False, indent=2)
+            with open(self.config_file, "wb") as f:
+                f.write(_dump_config(self.config))
             return True
         except OSError:
             return False
 
     def update_config(self, **kwargs: Any) -> bool:
-        """更新配置并保存。
+        """更新配置并保存，配置没有变化时不写文件。
 
         Args:
             **kwargs: 要更新的配置项，键名必须是 RenameConfig 的属性名
@@ -137,11 +181,14 @@ class ConfigManager:
             >>> manager.update_config(max_filename_length=100, auto_backup=True)
             True
         """
+        before = asdict(self.config)
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
         # 重新验证
         self.config.__post_init__()
+        if asdict(self.config) == before:
+            return True
         return self.save_config()
 
 
@@ -13,27 +13,50 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import queue
+import re
 import shutil
+import sys
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
-from .config import config_manager
+from .config import RenameConfig, config_manager
 from .smart_text_extractor import SmartTextExtractor, ExtractedText
+from .title_cache import TitleCache
 
 # 文件名处理常量
 ILLEGAL_CHARS = '<>:"/\\|?*'
+_ILLEGAL_TABLE = str.maketrans("", "", ILLEGAL_CHARS)
+_ILLEGAL_SET = frozenset(ILLEGAL_CHARS)
+_MULTI_SPACE_RE = re.compile(r" {2,}")
 BACKUP_DIR_NAME = "backup"
 MAX_CONFLICT_ATTEMPTS = 1000
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 
+# Python 3.10+ 的 dataclass 支持 slots，结果对象不再各带一个 __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# 并行处理常量：文件数少于此值时不启动进程池，避免进程启动开销
+PARALLEL_MIN_FILES = 2
+# 每个工作进程预先提交的任务数，保持进程池满载，又不一次提交整个批次
+SUBMIT_AHEAD_PER_WORKER = 2
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RenameResult:
     """单个文件的重命名结果。
 
     记录重命名操作的完整信息，包括原路径、新路径、成功状态等。
+    创建后不可修改。
 
     Attributes:
         original_path: 原始文件路径
@@ -52,7 +75,7 @@ class RenameResult:
     backup_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessStats:
     """批量处理统计信息。
 
@@ -99,15 +122,160 @@ class ProcessStats:
 ProgressCallback = Callable[[int, int, Path, RenameResult], None]
 CancelCheck = Callable[[], bool]
 
+# 工作进程内的提取器实例，由进程池初始化函数在每个进程启动时创建
+_worker_extractor: Optional[SmartTextExtractor] = None
+
+# 工作进程内暂存日志记录的队列，每个任务结束后随结果一并返回主进程
+_worker_log_queue: Optional[queue.SimpleQueue] = None
+
+# 工作进程中提取器使用的 logger 名称
+WORKER_LOGGER_NAME = f"{__name__}.worker"
+
+
+def _init_worker() -> None:
+    """进程池初始化函数，每个工作进程启动时执行一次。
+
+    提前创建提取器，各任务复用同一实例，提取器本身不随任务序列化传递。
+    提取器的日志先暂存在进程内的队列中，随提取结果返回主进程，由主进程
+    的 logger 写入应用日志。
+    """
+    global _worker_extractor, _worker_log_queue
+    _worker_log_queue = queue.SimpleQueue()
+    logger = logging.getLogger(WORKER_LOGGER_NAME)
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(_worker_log_queue))
+    logger.setLevel(logging.INFO)
+    # fork 启动的进程继承了主进程的处理器，不再向上传递，避免写入无效副本
+    logger.propagate = False
+    _worker_extractor = SmartTextExtractor(logger)
+
+
+def _extract_in_worker(
+    file_path: Path,
+) -> Tuple[Optional[ExtractedText], List[logging.LogRecord]]:
+    """在工作进程中提取 PDF 标题。
+
+    模块级函数，可被进程池序列化调用。只做纯提取，不产生文件系统副作用，
+    重命名等操作仍在主进程中按顺序执行。
+
+    Args:
+        file_path: PDF 文件路径
+
+    Returns:
+        Tuple[Optional[ExtractedText], List[logging.LogRecord]]:
+            (提取结果, 提取过程中产生的日志记录) 元组，提取失败时结果为 None
+    """
+    try:
+        extracted = _worker_extractor.extract_title(file_path)
+    finally:
+        records = []
+        while not _worker_log_queue.empty():
+            records.append(_worker_log_queue.get())
+    return extracted, records
+
+
+def _pool_broken(future: Future) -> bool:
+    """判断提取任务是否因工作进程异常退出而失败。
+
+    Args:
+        future: 进程池中的提取任务
+
+    Returns:
+        bool: 进程池已损坏时返回 True
+    """
+    return (
+        future.done()
+        and not future.cancelled()
+        and isinstance(future.exception(), BrokenProcessPool)
+    )
+
+
+def scan_pdf_files(
+    folder: Path, recursive: bool = False
+) -> List[Tuple[Path, Optional[int]]]:
+    """扫描文件夹中的 PDF 文件。
+
+    使用 os.scandir 遍历目录，扩展名不区分大小写，文件大小直接取自目录
+    遍历结果。递归扫描时跳过备份目录和符号链接目录，无法读取的子目录
+    直接跳过。
+
+    Args:
+        folder: 文件夹路径
+        recursive: 是否包含子文件夹
+
+    Returns:
+        List[Tuple[Path, Optional[int]]]: 按路径排序的 (文件路径, 文件大小)
+        列表，无法读取大小时为 None
+
+    Raises:
+        OSError: 顶层文件夹无法读取
+    """
+    found: List[Tuple[Path, Optional[int]]] = []
+    root = os.fspath(folder)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.name.lower().endswith(".pdf") and entry.is_file():
+                        try:
+                            size: Optional[int] = entry.stat().st_size
+                        except OSError:
+                            size = None
+                        found.append((Path(entry.path), size))
+                    elif (
+                        recursive
+                        and entry.name != BACKUP_DIR_NAME
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        stack.append(entry.path)
+        except OSError:
+            if current == root:
+                raise
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """复制文件并保留修改时间等元数据。
+
+    Linux 上优先使用 os.copy_file_range，数据在内核中复制，Btrfs/XFS 等
+    支持 reflink 的文件系统上只共享数据块而不实际拷贝。其他平台或调用
+    失败时退回到 shutil.copy2。
+
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # 不支持的文件系统或内核，改用常规复制
+
+    shutil.copy2(src, dst)
+
 
 class FileProcessor:
     """文件处理器。
 
-    提供批量 PDF 重命名功能，支持进度回调和取消操作。
+    提供批量 PDF 重命名功能，支持进度回调和取消操作。启用并行处理时，
+    标题提取分发到进程池中执行，重命名仍在调用线程中按顺序完成。
 
     Attributes:
         logger: 日志记录器
         text_extractor: 文本提取器实例
+        title_cache: 标题提取结果缓存
 
     Example:
         >>> processor = FileProcessor()
@@ -115,85 +283,265 @@ class FileProcessor:
         >>> print(f"成功率: {stats.success_rate:.1%}")
     """
 
-    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        config: Optional[RenameConfig] = None,
+        title_cache: Optional[TitleCache] = None,
+    ) -> None:
         """初始化文件处理器。
 
         Args:
             logger: 日志记录器，如果为 None 则使用模块默认 logger
+            config: 使用的配置，如果为 None 则每次读取全局配置
+            title_cache: 标题缓存，如果为 None 则使用默认缓存文件
         """
         self.logger = logger or logging.getLogger(__name__)
-        self.text_extractor = SmartTextExtractor(self.logger)
+        self._config = config
+        self.title_cache = title_cache if title_cache is not None else TitleCache()
+        # 批次内各目录的文件名快照（小写折叠后计数），用于冲突检测
+        self._dir_names: Dict[Path, Counter] = {}
+        # 批次内已确认存在的备份目录，避免每个文件都调用 mkdir
+        self._backup_dirs: Set[Path] = set()
+        # 批次时间戳，同一批次的文件名和备份使用相同的时间戳
+        self._batch_ts: Optional[str] = None
+        # 当前批次使用的进程池，批次结束或调用 shutdown 后为 None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @functools.cached_property
+    def text_extractor(self) -> SmartTextExtractor:
+        """文本提取器，首次在当前进程中提取时创建。
+
+        并行处理时提取在工作进程中完成，主进程可能完全不需要它。
+
+        Returns:
+            SmartTextExtractor: 文本提取器实例
+        """
+        return SmartTextExtractor(self.logger)
 
     @property
-    def config(self):
+    def config(self) -> RenameConfig:
         """获取当前配置。
 
         Returns:
-            RenameConfig: 当前配置实例
+            RenameConfig: 创建时传入的配置，未传入时为全局配置
         """
-        return config_manager.config
+        return self._config if self._config is not None else config_manager.config
 
     def process_files(
         self,
         files: List[Path],
         progress_callback: Optional[ProgressCallback] = None,
         cancel_check: Optional[CancelCheck] = None,
+        dry_run: bool = False,
     ) -> Tuple[List[RenameResult], ProcessStats]:
         """批量处理文件。
 
         遍历文件列表，对每个文件执行重命名操作。支持进度回调和取消检查。
+        逐个处理的逻辑见 iter_process_files，这里收集全部结果后一次返回。
 
         Args:
             files: 待处理的文件列表
             progress_callback: 进度回调函数，签名为 (当前索引, 总数, 当前文件, 结果)
             cancel_check: 取消检查函数，返回 True 时停止处理
+            dry_run: 为 True 时只计算目标文件名，不备份也不重命名（用于预览）
 
         Returns:
             Tuple[List[RenameResult], ProcessStats]: (结果列表, 统计信息) 元组
         """
-        stats = ProcessStats(total_files=len(files), start_time=datetime.now())
+        stats = ProcessStats()
         results: List[RenameResult] = []
 
-        for idx, file_path in enumerate(files, start=1):
-            # 检查取消
-            if cancel_check and cancel_check():
-                self.logger.info("用户取消处理")
-                break
-
-            result = self._process_single(file_path)
+        for idx, result in enumerate(
+            self.iter_process_files(files, stats, cancel_check, dry_run), start=1
+        ):
             results.append(result)
+            if progress_callback:
+                progress_callback(idx, len(files), result.original_path, result)
 
-            if result.success:
-                stats.successful += 1
-            else:
-                stats.failed += 1
+        return results, stats
 
-            if progress_callback:
-                progress_callback(idx, len(files), file_path, result)
+    def iter_process_files(
+        self,
+        files: List[Path],
+        stats: ProcessStats,
+        cancel_check: Optional[CancelCheck] = None,
+        dry_run: bool = False,
+    ) -> Iterator[RenameResult]:
+        """逐个处理文件并产出结果。
 
-        stats.total_files = len(results)
-        stats.end_time = datetime.now()
+        结果处理完即产出，调用方可以边处理边保存或显示，无需在内存中保留
+        整个批次的结果。启用并行处理时，标题提取提前提交到进程池（进程池
+        中最多保持约两倍工作进程数的任务），结果按原顺序消费，保证冲突
+        处理的顺序确定。内容相同的文件
+        （含之前处理过、已重命名的文件）直接复用缓存结果，不再重复提取，
+        因此预览后再正式处理不会重复解析 PDF。
 
-        self.logger.info(
-            f"处理完成: {stats.successful}/{stats.total_files} 成功, "
-            f"用时 {stats.duration:.1f}秒"
-        )
-        return results, stats
+        Args:
+            files: 待处理的文件列表
+            stats: 统计信息，处理过程中原地更新，迭代结束后填写结束时间
+            cancel_check: 取消检查函数，返回 True 时停止处理
+            dry_run: 为 True 时只计算目标文件名，不备份也不重命名（用于预览）
+
+        Yields:
+            RenameResult: 单个文件的处理结果
+        """
+        stats.total_files = len(files)
+        stats.start_time = datetime.now()
+        self._dir_names.clear()
+        self._backup_dirs.clear()
+        self._batch_ts = stats.start_time.strftime(TIMESTAMP_FORMAT)
+
+        # 并行模式下标题提取提交到进程池，主线程按原顺序消费结果并重命名。
+        # 只提前提交有限个文件，每消费一个结果补充一个，取消时丢弃的任务很少
+        workers = self._worker_count(len(files))
+        self._executor = self._create_executor(workers)
+        ahead = SUBMIT_AHEAD_PER_WORKER * workers if self._executor else 1
+        window: Deque[Tuple[Path, Optional[Future], Optional[str]]] = deque()
+        upcoming = iter(files)
+        submitted: Set[Optional[str]] = set()
+
+        try:
+            self._fill_window(window, upcoming, submitted, ahead)
+            while window:
+                # 检查取消
+                if cancel_check and cancel_check():
+                    self.logger.info("用户取消处理")
+                    break
+
+                file_path, future, key = window.popleft()
+                self._fill_window(window, upcoming, submitted, ahead)
+                result = self._process_single(file_path, future, key, dry_run)
+                if future is not None and _pool_broken(future):
+                    # 工作进程异常退出后整个进程池不可再用，只有当前文件记为
+                    # 失败，剩余文件改为在当前线程中顺序提取
+                    self.logger.warning("提取进程异常退出，剩余文件改为顺序处理")
+                    self.shutdown()
+                    window = deque((fp, None, k) for fp, _, k in window)
+                if result.success:
+                    stats.successful += 1
+                else:
+                    stats.failed += 1
+
+                yield result
+        finally:
+            self.shutdown()
+            self.title_cache.save()
+            self._batch_ts = None
+
+            stats.total_files = stats.successful + stats.failed
+            stats.end_time = datetime.now()
+            self.logger.info(
+                "处理完成: %d/%d 成功, 用时 %.1f秒",
+                stats.successful, stats.total_files, stats.duration,
+            )
+
+    def shutdown(self) -> None:
+        """停止当前批次的进程池。
+
+        取消尚未开始的提取任务，不等待正在运行的任务。可以在其他线程中
+        调用（如关闭窗口时），正在进行的批次随后按取消处理。
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fill_window(
+        self,
+        window: Deque[Tuple[Path, Optional[Future], Optional[str]]],
+        upcoming: Iterator[Path],
+        submitted: Set[Optional[str]],
+        size: int,
+    ) -> None:
+        """补充待处理窗口，窗口内需要提取的文件提交到进程池。
+
+        命中缓存的文件无需重新提取，批次内内容相同的文件只提交一次。
+
+        Args:
+            window: 待处理窗口，元素为 (文件路径, 提取任务, 缓存键)
+            upcoming: 尚未进入窗口的文件
+            submitted: 本批次已提交提取的缓存键
+            size: 窗口大小
+        """
+        while len(window) < size:
+            file_path = next(upcoming, None)
+            if file_path is None:
+                return
+            key = self.title_cache.make_key(file_path)
+            future = None
+            executor = self._executor
+            if executor is not None and (
+                key is None
+                or (key not in submitted and key not in self.title_cache)
+            ):
+                try:
+                    future = executor.submit(_extract_in_worker, file_path)
+                except RuntimeError:
+                    # 其他线程（如关闭窗口时）已调用 shutdown，不再继续提交
+                    window.append((file_path, None, key))
+                    return
+                submitted.add(key)
+            window.append((file_path, future, key))
+
+    def _worker_count(self, file_count: int) -> int:
+        """按配置计算标题提取的工作进程数。
+
+        Args:
+            file_count: 待处理文件数
+
+        Returns:
+            int: 工作进程数；不使用并行时返回 0
+        """
+        if not self.config.parallel_processing or file_count < PARALLEL_MIN_FILES:
+            return 0
+        workers = min(self.config.max_workers, file_count, os.cpu_count() or 1)
+        return workers if workers >= 2 else 0
 
-    def _process_single(self, file_path: Path) -> RenameResult:
+    def _create_executor(self, workers: int) -> Optional[ProcessPoolExecutor]:
+        """创建标题提取进程池。
+
+        工作进程数不足两个或进程池创建失败时返回 None，此时退回到当前
+        线程内顺序提取。工作进程在首次提交任务时才启动，全部命中缓存的
+        批次不会产生进程启动开销。
+
+        Args:
+            workers: 工作进程数
+
+        Returns:
+            ProcessPoolExecutor: 进程池实例；不使用并行时返回 None
+        """
+        if workers < 2:
+            return None
+
+        try:
+            return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        except (OSError, ValueError, NotImplementedError) as e:
+            self.logger.warning("无法启动并行处理，改为顺序处理: %s", e)
+            return None
+
+    def _process_single(
+        self,
+        file_path: Path,
+        pending: Optional[Future] = None,
+        cache_key: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> RenameResult:
         """处理单个文件。
 
         Args:
             file_path: 文件路径
+            pending: 进程池中的标题提取任务；为 None 时在当前线程提取
+            cache_key: 标题缓存键，为 None 时不使用缓存
+            dry_run: 为 True 时只计算目标文件名，不备份也不重命名
 
         Returns:
             RenameResult: 处理结果
         """
+        name = file_path.name
         try:
-            self.logger.info(f"处理: {file_path.name}")
+            self.logger.info("处理: %s", name)
 
-            # 提取标题
-            extracted = self.text_extractor.extract_title(file_path)
+            extracted = self._extract(file_path, pending, cache_key)
             if not extracted:
                 return self._make_error_result(file_path, "无法提取标题")
 
@@ -209,7 +557,7 @@ class FileProcessor:
             target = self._resolve_conflict(file_path.parent / new_filename, file_path)
 
             # 无需重命名
-            if target.name == file_path.name:
+            if target.name == name:
                 return RenameResult(
                     original_path=file_path,
                     new_path=file_path,
@@ -220,12 +568,16 @@ class FileProcessor:
 
             # 备份（如果启用）
             backup_path = None
-            if self.config.auto_backup:
+            if self.config.auto_backup and not dry_run:
                 backup_path = self._create_backup(file_path)
 
-            # 执行重命名
-            file_path.rename(target)
-            self.logger.info(f"重命名: {file_path.name} -> {target.name}")
+            # 执行重命名；预览时只更新快照，后续文件的冲突判断与实际处理一致
+            if not dry_run:
+                file_path.rename(target)
+            self._record_rename(file_path, target)
+            self.logger.info(
+                "%s: %s -> %s", "预览" if dry_run else "重命名", name, target.name
+            )
 
             return RenameResult(
                 original_path=file_path,
@@ -237,9 +589,45 @@ class FileProcessor:
             )
 
         except Exception as e:
-            self.logger.error(f"处理失败 {file_path.name}: {e}")
+            self.logger.error("处理失败 %s: %s", name, e)
             return self._make_error_result(file_path, str(e))
 
+    def _extract(
+        self,
+        file_path: Path,
+        pending: Optional[Future],
+        cache_key: Optional[str],
+    ) -> Optional[ExtractedText]:
+        """获取文件标题，优先使用缓存结果。
+
+        Args:
+            file_path: 文件路径
+            pending: 进程池中的标题提取任务；为 None 时在当前线程提取
+            cache_key: 标题缓存键
+
+        Returns:
+            ExtractedText: 提取结果；提取失败时返回 None
+        """
+        extracted = self.title_cache.get(cache_key)
+        if extracted is not None:
+            return extracted
+
+        # 并行模式下等待工作进程的提取结果
+        if pending is not None:
+            try:
+                extracted, records = pending.result()
+            except BrokenProcessPool as e:
+                raise RuntimeError("提取进程异常退出") from e
+            # 工作进程的日志交给本进程的 logger，与其他日志写入同一文件
+            for record in records:
+                self.logger.handle(record)
+        else:
+            extracted = self.text_extractor.extract_title(file_path)
+
+        if extracted is not None:
+            self.title_cache.put(cache_key, extracted)
+        return extracted
+
     def _make_error_result(
         self,
         file_path: Path,
@@ -274,19 +662,16 @@ class FileProcessor:
             str: 清理后的文件名
         """
         name = text.strip()
-        if not name:
-            return ""
 
-        # 移除非法字符
-        for ch in ILLEGAL_CHARS:
-            name = name.replace(ch, "")
-
-        # 合并连续空格
-        while "  " in name:
-            name = name.replace("  ", " ")
-
-        # 去除首尾点和空格
-        name = name.strip(". ")
+        # 移除非法字符，合并连续空格，去除首尾点和空格；
+        # 常见的已是合法文件名的标题跳过这些替换
+        if not (
+            _ILLEGAL_SET.isdisjoint(name)
+            and "  " not in name
+            and not name.startswith(".")
+            and not name.endswith(".")
+        ):
+            name = _MULTI_SPACE_RE.sub(" ", name.translate(_ILLEGAL_TABLE)).strip(". ")
 
         # 截断过长文件名
         max_len = self.config.max_filename_length
@@ -308,7 +693,7 @@ class FileProcessor:
         filename = base_name
 
         if self.config.add_timestamp:
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ts = self._timestamp()
             filename = f"{filename}_{ts}"
 
         return f"{filename}{original_path.suffix}"
@@ -316,7 +701,9 @@ class FileProcessor:
     def _resolve_conflict(self, target: Path, original: Path) -> Path:
         """解决文件名冲突。
 
-        如果目标文件已存在，尝试添加数字后缀或时间戳。
+        如果目标文件已存在，尝试添加数字后缀或时间戳。冲突检测使用目录
+        文件名快照，不逐个候选名访问文件系统。原文件自身的名字视为可用，
+        已带后缀的文件重复处理时保持原名。
 
         Args:
             target: 目标路径
@@ -325,26 +712,99 @@ class FileProcessor:
         Returns:
             Path: 不冲突的目标路径
         """
-        if not target.exists() or target == original:
+        parent = target.parent
+        names = self._get_dir_names(parent)
+        original_key = original.name.casefold()
+        if self._is_name_free(target.name, original, original_key, names):
             return target
 
         base = target.stem
         suffix = target.suffix
-        parent = target.parent
 
         # 尝试数字后缀
         for idx in range(1, MAX_CONFLICT_ATTEMPTS):
-            candidate = parent / f"{base}_{idx}{suffix}"
-            if not candidate.exists():
-                return candidate
+            name = f"{base}_{idx}{suffix}"
+            if self._is_name_free(name, original, original_key, names):
+                return parent / name
 
         # 最后使用时间戳
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = self._timestamp()
         return parent / f"{base}_{ts}{suffix}"
 
+    def _timestamp(self) -> str:
+        """获取文件名使用的时间戳。
+
+        Returns:
+            str: 批次处理中返回批次开始时间，否则返回当前时间
+        """
+        return self._batch_ts or datetime.now().strftime(TIMESTAMP_FORMAT)
+
+    def _get_dir_names(self, directory: Path) -> Counter:
+        """获取目录文件名快照，每个批次每个目录只读取一次。
+
+        文件名统一小写折叠，大小写不敏感的文件系统（Windows、macOS）上
+        仅大小写不同的名字也视为冲突。
+
+        Args:
+            directory: 目录路径
+
+        Returns:
+            Counter: 折叠后的文件名计数
+        """
+        names = self._dir_names.get(directory)
+        if names is None:
+            names = Counter(name.casefold() for name in os.listdir(directory))
+            self._dir_names[directory] = names
+        return names
+
+    @staticmethod
+    def _is_name_free(
+        name: str, original: Path, original_key: str, names: Counter
+    ) -> bool:
+        """判断目标文件名是否可用。
+
+        Args:
+            name: 候选文件名
+            original: 原始文件路径
+            original_key: 原始文件名小写折叠后的结果
+            names: 目录文件名快照
+
+        Returns:
+            bool: 未被其他文件占用时返回 True
+        """
+        key = name.casefold()
+        if key != original_key:
+            return key not in names
+        if name == original.name:
+            return True
+        # 与原文件仅大小写不同：大小写不敏感的文件系统上指向原文件本身
+        try:
+            return (original.parent / name).samefile(original)
+        except OSError:
+            return True
+
+    def _record_rename(self, source: Path, target: Path) -> None:
+        """重命名后同步更新目录文件名快照。
+
+        Args:
+            source: 原路径
+            target: 新路径
+        """
+        names = self._dir_names.get(source.parent)
+        if names is None:
+            return
+        names[target.name.casefold()] += 1
+        key = source.name.casefold()
+        names[key] -= 1
+        if names[key] <= 0:
+            del names[key]
+
     def _create_backup(self, file_path: Path) -> Optional[Path]:
         """创建文件备份。
 
+        启用 backup_use_hardlink 时优先创建硬链接，无需复制数据；
+        跨设备或文件系统不支持时退回到复制。
+
         Args:
             file_path: 原始文件路径
 
@@ -353,15 +813,36 @@ class FileProcessor:
         """
         try:
             backup_dir = file_path.parent / BACKUP_DIR_NAME
-            backup_dir.mkdir(exist_ok=True)
+            if backup_dir not in self._backup_dirs:
+                backup_dir.mkdir(exist_ok=True)
+                self._backup_dirs.add(backup_dir)
 
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ts = self._timestamp()
             backup_name = f"{file_path.stem}_{ts}{file_path.suffix}"
             backup_path = backup_dir / backup_name
 
-            shutil.copy2(file_path, backup_path)
-            self.logger.info(f"备份: {backup_path}")
+            use_link = self.config.backup_use_hardlink
+            if not (use_link and self._link_file(file_path, backup_path)):
+                _copy_file(file_path, backup_path)
+            self.logger.info("备份: %s", backup_path)
             return backup_path
         except Exception as e:
-            self.logger.warning(f"备份失败: {e}")
+            self.logger.warning("备份失败: %s", e)
             return None
+
+    @staticmethod
+    def _link_file(src: Path, dst: Path) -> bool:
+        """为文件创建硬链接。
+
+        Args:
+            src: 源文件路径
+            dst: 链接路径
+
+        Returns:
+            bool: 创建成功返回 True，跨设备或不支持时返回 False
+        """
+        try:
+            os.link(src, dst)
+            return True
+        except (OSError, NotImplementedError):
+            return False
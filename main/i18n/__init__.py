@@ -12,18 +12,25 @@ Version: 1.0.0
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Mapping, Optional, Tuple
 
 # 可用语言列表：(语言代码, 显示名称)
-AVAILABLE_LANGUAGES: List[Tuple[str, str]] = [
+AVAILABLE_LANGUAGES: Tuple[Tuple[str, str], ...] = (
     ("zh_CN", "中文"),
     ("en_US", "English"),
-]
+)
 
 # 默认语言
 DEFAULT_LANGUAGE = "zh_CN"
 
 
+class _KeepMissing(dict):
+    """格式化参数字典，缺少的参数原样保留为 "{name}" 占位符。"""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
 class I18nManager:
     """国际化管理器。
 
@@ -31,7 +38,7 @@ class I18nManager:
 
     Attributes:
         current_language: 当前语言代码 (zh_CN, en_US)
-        translations: 当前语言的翻译字典
+        translations: 当前语言的翻译字典（直接引用语言包，只读）
 
     Example:
         >>> i18n = I18nManager()
@@ -56,7 +63,7 @@ class I18nManager:
             return
         I18nManager._initialized = True
         self.current_language = DEFAULT_LANGUAGE
-        self.translations: Dict[str, str] = {}
+        self.translations: Mapping[str, str] = {}
         self._load_language(self.current_language)
 
     def _load_language(self, lang_code: str) -> bool:
@@ -78,7 +85,8 @@ class I18nManager:
                 from .zh_CN import TRANSLATIONS
                 lang_code = DEFAULT_LANGUAGE
 
-            self.translations = TRANSLATIONS.copy()
+            # 语言包只读，直接引用模块级字典，无需复制
+            self.translations = TRANSLATIONS
             self.current_language = lang_code
             return True
         except ImportError:
@@ -110,24 +118,25 @@ class I18nManager:
             **kwargs: 格式化参数
 
         Returns:
-            str: 翻译后的文本，如果键不存在则返回键本身
+            str: 翻译后的文本，如果键不存在则返回键本身；缺少的格式化参数
+            保留为占位符
         """
         text = self.translations.get(key, key)
         if kwargs:
             try:
-                return text.format(**kwargs)
-            except (KeyError, ValueError):
-                # 格式化失败，返回原文本
+                return text.format_map(_KeepMissing(kwargs))
+            except ValueError:
+                # 模板格式错误，返回原文本
                 return text
         return text
 
-    def get_available_languages(self) -> List[Tuple[str, str]]:
+    def get_available_languages(self) -> Tuple[Tuple[str, str], ...]:
         """获取可用语言列表。
 
         Returns:
-            List[Tuple[str, str]]: [(语言代码, 显示名称), ...]
+            Tuple[Tuple[str, str], ...]: ((语言代码, 显示名称), ...)，不可变
         """
-        return AVAILABLE_LANGUAGES.copy()
+        return AVAILABLE_LANGUAGES
 
     def get_language_display_name(self, lang_code: str) -> str:
         """获取语言的显示名称。
@@ -43,6 +43,7 @@ TRANSLATIONS = {
     "settings.backup": "📦 Auto Backup Original Files",
     "settings.parallel": "⚡ Parallel Processing (Faster)",
     "settings.timestamp": "🕐 Add Timestamp Suffix",
+    "settings.recursive": "📂 Include Subfolders",
     "settings.language": "🌐 Language",
     "settings.language.restart_hint": "Restart required for full language change",
 
@@ -59,6 +60,7 @@ TRANSLATIONS = {
     "status.selected": "✅ {count} files selected. Click 'Start Processing' to rename",
     "status.processing": "🚀 Processing {count} files...",
     "status.generating_preview": "⏳ Generating preview...",
+    "status.scanning": "🔍 Scanning folder...",
     "status.preview_done": "👁️ Preview done: {success}/{total} can be renamed",
     "status.done": "{emoji} Done: {success}/{total} succeeded in {time}s",
     "status.cancelled": "⚠️ Cancelled: Processed {total} files, {success} succeeded",
@@ -78,6 +80,7 @@ TRANSLATIONS = {
     "log.preview_start": "Generating preview...",
     "log.preview_result": "📋 Preview result: {success}/{total} can be renamed",
     "log.preview_failed": "❌ Preview failed: {error}",
+    "log.scan_failed": "❌ Failed to read folder: {error}",
     "log.process_start": "🚀 Processing {count} files",
     "log.process_failed": "❌ Processing failed: {error}",
     "log.process_done": "{emoji} Processing complete!",
@@ -43,6 +43,7 @@ TRANSLATIONS = {
     "settings.backup": "📦 自动备份原文件",
     "settings.parallel": "⚡ 并行处理（更快）",
     "settings.timestamp": "🕐 添加时间戳后缀",
+    "settings.recursive": "📂 选择文件夹时包含子文件夹",
     "settings.language": "🌐 语言",
     "settings.language.restart_hint": "语言切换后需要重启应用才能完全生效",
 
@@ -59,6 +60,7 @@ TRANSLATIONS = {
     "status.selected": "✅ 已选择 {count} 个文件，点击「开始处理」进行重命名",
     "status.processing": "🚀 正在处理 {count} 个文件...",
     "status.generating_preview": "⏳ 正在生成预览...",
+    "status.scanning": "🔍 正在扫描文件夹...",
     "status.preview_done": "👁️ 预览完成: {success}/{total} 可重命名",
     "status.done": "{emoji} 完成: {success}/{total} 成功，用时 {time}s",
     "status.cancelled": "⚠️ 已取消: 处理了 {total} 个文件，{success} 成功",
@@ -78,6 +80,7 @@ TRANSLATIONS = {
     "log.preview_start": "开始生成预览...",
     "log.preview_result": "📋 预览结果: {success}/{total} 可重命名",
     "log.preview_failed": "❌ 预览失败: {error}",
+    "log.scan_failed": "❌ 读取文件夹失败: {error}",
     "log.process_start": "🚀 开始处理 {count} 个文件",
     "log.process_failed": "❌ 处理失败: {error}",
     "log.process_done": "{emoji} 处理完成!",
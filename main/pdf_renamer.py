@@ -13,18 +13,22 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import os
+import queue
 import threading
 import time
 import tkinter.messagebox as messagebox
-from datetime import datetime
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import customtkinter as ctk
 
 from .config import config_manager
-from .file_processor import FileProcessor, RenameResult
+from .file_processor import (
+    _DATACLASS_SLOTS, FileProcessor, ProcessStats, RenameResult, scan_pdf_files,
+)
 from .i18n import i18n, I18nManager
 from .utils import setup_logging
 
@@ -59,6 +63,58 @@ COLORS = {
 WINDOW_SIZE = "1100x750"
 WINDOW_MIN_SIZE = (1000, 700)
 ICON_FILENAME = "huge_icon.ico"
+ICON_PATH = Path(__file__).resolve().parent.parent / "resources" / ICON_FILENAME
+
+# 进度刷新节流：进度条和标签最短刷新间隔（秒），结果列表的刷新间隔和批量大小
+PROGRESS_UPDATE_INTERVAL = 0.1
+RESULTS_FLUSH_INTERVAL = 0.3
+RESULTS_FLUSH_BATCH = 50
+
+# 日志区域刷新间隔（毫秒），期间的日志合并为一次插入
+LOG_FLUSH_INTERVAL_MS = 100
+
+# 处理结果和日志区域最多保留的行数，超出时从顶部删除约十分之一，
+# 避免长批次中文本控件无限增长
+RESULTS_MAX_LINES = 5000
+LOG_MAX_LINES = 1000
+
+# 处理期间主线程轮询工作线程事件队列的间隔（毫秒），约每帧一次
+EVENT_POLL_INTERVAL_MS = 16
+
+
+# ============================================================
+# 辅助函数
+# ============================================================
+
+
+def _wheel_units(delta: int) -> int:
+    """将滚轮事件的 delta 换算为滚动行数（Windows 下每格 120）。
+
+    向零取整，触控板产生的不足一格的 delta 不会滚动。
+    """
+    return int(-delta / 120)
+
+
+# ============================================================
+# 数据类
+# ============================================================
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class FileEntry:
+    """已选择的文件。
+
+    文件名和大小在选择时一并记录，刷新列表时不再重复计算或读取。
+
+    Attributes:
+        path: 文件路径
+        name: 文件名
+        size: 文件大小（字节），尚未读取或无法读取时为 None
+    """
+
+    path: Path
+    name: str
+    size: Optional[int]
 
 
 # ============================================================
@@ -74,7 +130,7 @@ class MainApp(ctk.CTk):
     Attributes:
         logger: 日志记录器
         processor: 文件处理器
-        selected_files: 已选择的文件列表
+        selected_files: 已选择的文件列表（FileEntry）
         is_processing: 是否正在处理中
         cancel_requested: 是否请求取消
         i18n: 国际化管理器
@@ -87,7 +143,7 @@ class MainApp(ctk.CTk):
         self._setup_window()
         self._init_state()
         self._create_widgets()
-        self.logger.info(f"{i18n.get('app.name')} {APP_VERSION} 启动")
+        self.logger.info("%s %s 启动", i18n.get("app.name"), APP_VERSION)
 
     # --------------------------------------------------------
     # 初始化
@@ -113,9 +169,8 @@ class MainApp(ctk.CTk):
     def _set_icon(self) -> None:
         """设置窗口图标。"""
         try:
-            icon_path = Path(__file__).resolve().parent.parent / "resources" / ICON_FILENAME
-            if icon_path.exists():
-                self.wm_iconbitmap(icon_path)
+            if ICON_PATH.exists():
+                self.wm_iconbitmap(ICON_PATH)
         except Exception:
             pass
 
@@ -123,16 +178,64 @@ class MainApp(ctk.CTk):
         """初始化应用状态。"""
         self.logger, _ = setup_logging()
         self.processor = FileProcessor(self.logger)
-        self.selected_files: List[Path] = []
+        self.selected_files: List[FileEntry] = []
         self.is_processing = False
         self.cancel_requested = False
+        # 后台扫描文件夹期间为 True
+        self._scanning = False
         self._pending_results: List[Tuple[int, RenameResult]] = []
         self._last_ui_update = 0.0
+        self._last_progress_update = 0.0
+        # 工作线程产生的事件放入队列，由主线程定时批量取走
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        # 预览和处理任务交给同一个常驻线程按提交顺序执行，不会同时运行
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._run_jobs, daemon=True).start()
+        # 相同参数的字体只创建一次，在组件间共享
+        self._fonts: Dict[Tuple[Optional[str], int, Optional[str]], ctk.CTkFont] = {}
+        # 文件列表刷新代数，后台线程生成的过期文本不再显示
+        self._file_list_gen = 0
+        # 文件列表文本框最近一次设置的属性，相同的值不再重复设置
+        self._files_textbox_opts: Dict[str, str] = {
+            "state": "normal", "text_color": COLORS["text"],
+        }
+        # 待写入日志区域的文本，定时合并刷新
+        self._log_buffer: List[str] = []
+
+    def _run_jobs(self) -> None:
+        """常驻工作线程，依次执行预览和处理任务。"""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                # 任务自身会报告错误，这里只保证线程不退出
+                self.logger.exception("后台任务异常")
 
     # --------------------------------------------------------
     # UI 构建
     # --------------------------------------------------------
 
+    def _font(
+        self, size: int, weight: Optional[str] = None, family: Optional[str] = None
+    ) -> ctk.CTkFont:
+        """获取字体，相同参数只创建一个 Tk 字体对象。
+
+        Args:
+            size: 字号
+            weight: 字重，"normal" 或 "bold"，为 None 时使用主题默认字重
+            family: 字体族，为 None 时使用主题默认字体
+
+        Returns:
+            ctk.CTkFont: 字体实例
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self._fonts[key] = font
+        return font
+
     def _create_widgets(self) -> None:
         """创建所有 UI 组件。"""
         self.grid_columnconfigure(0, weight=1)
@@ -147,6 +250,11 @@ class MainApp(ctk.CTk):
         self._create_content(main_container)
         self._create_status_bar(main_container)
 
+        # ESC 键取消处理（事件驱动，无需轮询键盘）
+        self.bind("<Escape>", self._on_escape)
+        # 关闭窗口时先停止进程池，退出时不再等待排队中的提取任务
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _create_header(self, parent: ctk.CTkFrame) -> None:
         """创建顶部标题栏。"""
         header = ctk.CTkFrame(
@@ -160,7 +268,7 @@ class MainApp(ctk.CTk):
         title_frame = ctk.CTkFrame(header, fg_color="transparent")
         title_frame.grid(row=0, column=0, padx=24, pady=20, sticky="w")
 
-        ctk.CTkLabel(title_frame, text="🐯", font=ctk.CTkFont(size=36)).pack(
+        ctk.CTkLabel(title_frame, text="🐯", font=self._font(size=36)).pack(
             side="left", padx=(0, 12)
         )
 
@@ -170,14 +278,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_text,
             text=i18n.get("app.name"),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=24, weight="bold"),
+            font=self._font(family="Microsoft YaHei", size=24, weight="bold"),
             text_color=COLORS["text"],
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             title_text,
             text=i18n.get("app.subtitle"),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text_muted"],
         ).pack(anchor="w")
 
@@ -185,7 +293,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text=APP_VERSION,
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text_muted"],
             fg_color=COLORS["bg_input"],
             corner_radius=6,
@@ -218,14 +326,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text=i18n.get("panel.files"),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=16, weight="bold"),
+            font=self._font(family="Microsoft YaHei", size=16, weight="bold"),
             text_color=COLORS["text"],
         ).pack(side="left")
 
         self.file_count_label = ctk.CTkLabel(
             header,
             text=i18n.get("panel.files.count", count=0),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text_muted"],
         )
         self.file_count_label.pack(side="right")
@@ -238,7 +346,7 @@ class MainApp(ctk.CTk):
             panel,
             fg_color=COLORS["bg_input"],
             text_color=COLORS["text"],
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=self._font(family="Consolas", size=12),
             corner_radius=8,
             border_width=0,
             wrap="word",
@@ -252,29 +360,31 @@ class MainApp(ctk.CTk):
         btn_frame = ctk.CTkFrame(panel, fg_color="transparent")
         btn_frame.grid(row=1, column=0, padx=20, pady=(0, 12), sticky="ew")
 
-        ctk.CTkButton(
+        self.select_files_btn = ctk.CTkButton(
             btn_frame,
             text=i18n.get("btn.select_files"),
             command=self._select_files,
             fg_color=COLORS["primary"],
             hover_color=COLORS["primary_hover"],
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             height=36,
             corner_radius=8,
-        ).pack(side="left", padx=(0, 8))
+        )
+        self.select_files_btn.pack(side="left", padx=(0, 8))
 
-        ctk.CTkButton(
+        self.select_folder_btn = ctk.CTkButton(
             btn_frame,
             text=i18n.get("btn.select_folder"),
             command=self._select_folder,
             fg_color=COLORS["bg_input"],
             hover_color=COLORS["border"],
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             height=36,
             corner_radius=8,
-        ).pack(side="left", padx=(0, 8))
+        )
+        self.select_folder_btn.pack(side="left", padx=(0, 8))
 
-        ctk.CTkButton(
+        self.clear_btn = ctk.CTkButton(
             btn_frame,
             text=i18n.get("btn.clear"),
             command=self._clear_files,
@@ -282,11 +392,31 @@ class MainApp(ctk.CTk):
             hover_color=COLORS["error"],
             border_width=1,
             border_color=COLORS["border"],
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             height=36,
             width=80,
             corner_radius=8,
-        ).pack(side="left")
+        )
+        self.clear_btn.pack(side="left")
+
+    def _update_file_buttons(self) -> None:
+        """扫描文件夹或处理期间禁用文件选择和清空按钮。"""
+        state = "disabled" if self.is_processing or self._scanning else "normal"
+        for btn in (self.select_files_btn, self.select_folder_btn, self.clear_btn):
+            btn.configure(state=state)
+
+    def _configure_files_textbox(self, **kwargs: str) -> None:
+        """设置文件列表文本框属性，跳过与当前值相同的属性。
+
+        Args:
+            **kwargs: 传给 configure 的属性
+        """
+        changed = {
+            k: v for k, v in kwargs.items() if self._files_textbox_opts.get(k) != v
+        }
+        if changed:
+            self.files_textbox.configure(**changed)
+            self._files_textbox_opts.update(changed)
 
     def _show_placeholder_text(self) -> None:
         """显示占位提示文字。"""
@@ -294,15 +424,15 @@ class MainApp(ctk.CTk):
             "1.0",
             i18n.get("panel.files.placeholder"),
         )
-        self.files_textbox.configure(state="disabled", text_color=COLORS["text_muted"])
+        self._configure_files_textbox(state="disabled", text_color=COLORS["text_muted"])
 
     def _on_files_scroll(self, event) -> None:
         """文件列表滚轮事件。"""
-        self.files_textbox._textbox.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.files_textbox._textbox.yview_scroll(_wheel_units(event.delta), "units")
 
     def _on_log_scroll(self, event) -> None:
         """日志区域滚轮事件。"""
-        self.log_text._textbox.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.log_text._textbox.yview_scroll(_wheel_units(event.delta), "units")
 
     def _create_control_panel(self, parent: ctk.CTkFrame) -> None:
         """创建右侧控制面板。"""
@@ -333,14 +463,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             mode_frame,
             text=i18n.get("mode.smart"),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14, weight="bold"),
+            font=self._font(family="Microsoft YaHei", size=14, weight="bold"),
             text_color=COLORS["primary"],
         ).pack(padx=16, pady=(12, 4), anchor="w")
 
         ctk.CTkLabel(
             mode_frame,
             text=i18n.get("mode.smart.desc"),
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             text_color=COLORS["text_muted"],
             justify="left",
         ).pack(padx=16, pady=(0, 12), anchor="w")
@@ -353,7 +483,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             settings_frame,
             text=i18n.get("settings.title"),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=14, weight="bold"),
+            font=self._font(family="Microsoft YaHei", size=14, weight="bold"),
             text_color=COLORS["text"],
         ).pack(anchor="w", pady=(0, 12))
 
@@ -366,7 +496,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             len_row,
             text=i18n.get("settings.max_length"),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text"],
         ).pack(side="left")
 
@@ -385,11 +515,13 @@ class MainApp(ctk.CTk):
         self.backup_var = ctk.BooleanVar(value=cfg.auto_backup)
         self.parallel_var = ctk.BooleanVar(value=cfg.parallel_processing)
         self.ts_var = ctk.BooleanVar(value=cfg.add_timestamp)
+        self.recursive_var = ctk.BooleanVar(value=cfg.recursive_scan)
 
         checkboxes = [
             (i18n.get("settings.backup"), self.backup_var),
             (i18n.get("settings.parallel"), self.parallel_var),
             (i18n.get("settings.timestamp"), self.ts_var),
+            (i18n.get("settings.recursive"), self.recursive_var),
         ]
 
         for text, var in checkboxes:
@@ -397,7 +529,7 @@ class MainApp(ctk.CTk):
                 settings_frame,
                 text=text,
                 variable=var,
-                font=ctk.CTkFont(size=12),
+                font=self._font(size=12),
                 text_color=COLORS["text"],
                 fg_color=COLORS["primary"],
                 hover_color=COLORS["primary_hover"],
@@ -416,7 +548,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             lang_row,
             text=i18n.get("settings.language"),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text"],
         ).pack(side="left")
 
@@ -440,7 +572,7 @@ class MainApp(ctk.CTk):
             button_hover_color=COLORS["primary_hover"],
             dropdown_fg_color=COLORS["bg_card"],
             dropdown_hover_color=COLORS["bg_input"],
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             width=100,
             height=32,
             corner_radius=6,
@@ -477,7 +609,7 @@ class MainApp(ctk.CTk):
             command=self._preview,
             fg_color=COLORS["bg_input"],
             hover_color=COLORS["border"],
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             height=44,
             corner_radius=8,
             state="disabled",
@@ -490,7 +622,7 @@ class MainApp(ctk.CTk):
             command=self._start,
             fg_color=COLORS["success"],
             hover_color=COLORS["success_hover"],
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self._font(size=15, weight="bold"),
             height=50,
             corner_radius=8,
             state="disabled",
@@ -503,7 +635,7 @@ class MainApp(ctk.CTk):
             command=self._cancel_processing,
             fg_color=COLORS["error"],
             hover_color=COLORS["error_hover"],
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             height=44,
             corner_radius=8,
             state="disabled",
@@ -520,7 +652,7 @@ class MainApp(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             progress_frame,
             text=i18n.get("progress.ready"),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text"],
         )
         self.progress_label.pack(padx=16, pady=(12, 8), anchor="w")
@@ -538,7 +670,7 @@ class MainApp(ctk.CTk):
         self.current_file_label = ctk.CTkLabel(
             progress_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             text_color=COLORS["text_muted"],
         )
         self.current_file_label.pack(padx=16, pady=(0, 12), anchor="w")
@@ -551,7 +683,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             log_frame,
             text=i18n.get("log.title"),
-            font=ctk.CTkFont(family="Microsoft YaHei", size=12, weight="bold"),
+            font=self._font(family="Microsoft YaHei", size=12, weight="bold"),
             text_color=COLORS["text"],
         ).pack(anchor="w", pady=(0, 8))
 
@@ -559,7 +691,7 @@ class MainApp(ctk.CTk):
             log_frame,
             fg_color=COLORS["bg_input"],
             text_color=COLORS["text_muted"],
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self._font(family="Consolas", size=11),
             corner_radius=8,
             height=150,
             wrap="word",
@@ -578,7 +710,7 @@ class MainApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             status_bar,
             text=i18n.get("status.ready"),
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=COLORS["text_muted"],
         )
         self.status_label.pack(side="left", padx=16, pady=10)
@@ -586,7 +718,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             status_bar,
             text=i18n.get("footer.author", author=APP_AUTHOR),
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             text_color=COLORS["text_muted"],
         ).pack(side="right", padx=16, pady=10)
 
@@ -604,16 +736,80 @@ class MainApp(ctk.CTk):
             ],
         )
         if paths:
-            self.selected_files.extend(Path(p) for p in paths)
-            self._refresh_file_list()
+            self._add_files(FileEntry(Path(p), Path(p).name, None) for p in paths)
 
     def _select_folder(self) -> None:
-        """选择文件夹。"""
+        """选择文件夹。
+
+        在后台线程中扫描，扫描完成后一次性加入列表，大文件夹不会阻塞界面。
+        扩展名不区分大小写，勾选“包含子文件夹”时递归扫描。
+        """
         folder = filedialog.askdirectory(title=i18n.get("dialog.select_folder"))
-        if folder:
-            pdfs = list(Path(folder).glob("*.pdf"))
-            self.selected_files.extend(pdfs)
-            self._refresh_file_list()
+        if not folder:
+            return
+
+        recursive = self.recursive_var.get()
+        self._scanning = True
+        self._update_file_buttons()
+        self.status_label.configure(text=i18n.get("status.scanning"))
+
+        def worker() -> None:
+            try:
+                found = scan_pdf_files(Path(folder), recursive)
+            except OSError as e:
+                self.logger.error("读取文件夹失败 %s: %s", folder, e)
+                self.after(0, self._on_scan_failed, str(e))
+                return
+            entries = [FileEntry(p, p.name, size) for p, size in found]
+            self.after(0, self._on_scan_done, entries)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_scan_done(self, entries: List[FileEntry]) -> None:
+        """文件夹扫描完成回调。
+
+        Args:
+            entries: 扫描到的文件
+        """
+        self._scanning = False
+        self._update_file_buttons()
+        self._add_files(entries)
+
+    def _on_scan_failed(self, error: str) -> None:
+        """文件夹扫描失败回调。
+
+        Args:
+            error: 错误信息
+        """
+        self._scanning = False
+        self._update_file_buttons()
+        self._log(i18n.get("log.scan_failed", error=error))
+        if self.is_processing:
+            return
+        count = len(self.selected_files)
+        self.status_label.configure(
+            text=i18n.get("status.selected", count=count) if count
+            else i18n.get("status.ready")
+        )
+
+    def _add_files(self, entries: Iterable[FileEntry]) -> None:
+        """添加文件到列表，跳过已选择的文件。
+
+        处理开始前发起的扫描可能在处理中完成，此时只加入列表，不刷新
+        文本框和按钮，避免覆盖正在显示的处理结果或重新启用开始按钮；
+        处理结束后由 _reset_ui 更新文件数。
+
+        Args:
+            entries: 待添加的文件
+        """
+        seen = {f.path for f in self.selected_files}
+        for entry in entries:
+            if entry.path not in seen:
+                seen.add(entry.path)
+                self.selected_files.append(entry)
+        if self.is_processing:
+            return
+        self._refresh_file_list()
 
     def _clear_files(self) -> None:
         """清空文件列表。"""
@@ -621,25 +817,26 @@ class MainApp(ctk.CTk):
         self._refresh_file_list()
 
     def _refresh_file_list(self) -> None:
-        """刷新文件列表显示。"""
-        self.files_textbox.configure(state="normal", text_color=COLORS["text"])
+        """刷新文件列表显示。
+
+        文件大小的读取和列表文本的拼接在后台线程中完成，完成后一次性
+        插入文本框，大量文件时不阻塞界面。
+        """
+        self._file_list_gen += 1
+        self._configure_files_textbox(state="normal", text_color=COLORS["text"])
         self.files_textbox.delete("1.0", "end")
 
         if not self.selected_files:
             self._show_placeholder_text()
         else:
-            for i, p in enumerate(self.selected_files, 1):
-                try:
-                    size_mb = p.stat().st_size / 1024 / 1024
-                    self.files_textbox.insert(
-                        "end", f"{i:3d}. {p.name}  ({size_mb:.1f} MB)\n"
-                    )
-                except OSError:
-                    self.files_textbox.insert(
-                        "end",
-                        f"{i:3d}. {p.name}  ({i18n.get('panel.files.unreadable')})\n"
-                    )
-            self.files_textbox.configure(state="disabled")
+            self._configure_files_textbox(state="disabled")
+            gen = self._file_list_gen
+            files = list(self.selected_files)
+            threading.Thread(
+                target=self._build_file_list_text,
+                args=(gen, files),
+                daemon=True,
+            ).start()
 
         count = len(self.selected_files)
         self.file_count_label.configure(text=i18n.get("panel.files.count", count=count))
@@ -653,6 +850,49 @@ class MainApp(ctk.CTk):
                 text=i18n.get("status.selected", count=count)
             )
 
+    def _build_file_list_text(self, gen: int, files: List[FileEntry]) -> None:
+        """在后台线程中生成文件列表文本。
+
+        尚未读取大小的文件在这里读取，不修改共享的 FileEntry，读到的
+        大小交回主线程记录。
+
+        Args:
+            gen: 发起刷新时的列表代数
+            files: 文件列表快照
+        """
+        unreadable = i18n.get("panel.files.unreadable")
+        lines = []
+        read_sizes: List[Tuple[FileEntry, int]] = []
+        for i, f in enumerate(files, 1):
+            size = f.size
+            if size is None:
+                try:
+                    size = f.path.stat().st_size
+                except OSError:
+                    lines.append(f"{i:3d}. {f.name}  ({unreadable})\n")
+                    continue
+                read_sizes.append((f, size))
+            lines.append(f"{i:3d}. {f.name}  ({size / 1024 / 1024:.1f} MB)\n")
+        self.after(0, self._apply_file_list_text, gen, "".join(lines), read_sizes)
+
+    def _apply_file_list_text(
+        self, gen: int, text: str, read_sizes: List[Tuple[FileEntry, int]]
+    ) -> None:
+        """将后台生成的文件列表文本一次性插入文本框。
+
+        Args:
+            gen: 生成文本时的列表代数，已过期时忽略
+            text: 文件列表文本
+            read_sizes: 后台线程新读取的 (文件, 大小)，记录后下次刷新不再读取
+        """
+        for entry, size in read_sizes:
+            entry.size = size
+        if gen != self._file_list_gen:
+            return
+        self._configure_files_textbox(state="normal")
+        self.files_textbox.insert("end", text)
+        self._configure_files_textbox(state="disabled")
+
     # --------------------------------------------------------
     # 设置与处理
     # --------------------------------------------------------
@@ -673,6 +913,7 @@ class MainApp(ctk.CTk):
             auto_backup=self.backup_var.get(),
             parallel_processing=self.parallel_var.get(),
             add_timestamp=self.ts_var.get(),
+            recursive_scan=self.recursive_var.get(),
         )
 
     def _preview(self) -> None:
@@ -687,32 +928,59 @@ class MainApp(ctk.CTk):
         self._apply_settings()
         self.status_label.configure(text=i18n.get("status.generating_preview"))
         self._log(i18n.get("log.preview_start"))
+        files = [f.path for f in self.selected_files]
 
         def worker() -> None:
             try:
-                results, _ = self.processor.process_files(self.selected_files)
-                self.after(0, lambda: self._show_preview_results(results))
+                results, _ = self.processor.process_files(files, dry_run=True)
+                # 结果文本在工作线程中生成，主线程只负责显示
+                lines, ok, total = self._format_preview_results(results)
+                self.after(0, self._show_preview_results, lines, ok, total)
             except Exception as e:
                 self.after(0, lambda: self._log(i18n.get("log.preview_failed", error=str(e))))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._jobs.put(worker)
+
+    def _format_preview_results(
+        self, results: List[RenameResult]
+    ) -> Tuple[List[str], int, int]:
+        """生成预览结果的日志文本，可在工作线程中调用。
+
+        Args:
+            results: 预览结果列表
 
-    def _show_preview_results(self, results: List[RenameResult]) -> None:
-        """显示预览结果。"""
+        Returns:
+            Tuple[List[str], int, int]: (日志行, 成功数, 总数)
+        """
         ok = sum(1 for r in results if r.success)
         total = len(results)
 
-        self._log(f"\n{'='*40}")
-        self._log(i18n.get("log.preview_result", success=ok, total=total))
-        self._log(f"{'='*40}")
+        lines = [
+            f"\n{'='*40}",
+            i18n.get("log.preview_result", success=ok, total=total),
+            f"{'='*40}",
+        ]
 
+        reason_fmt = i18n.get("log.reason")
         for r in results:
             if r.success and r.new_path is not None:
-                self._log(f"✅ {r.original_path.name}")
-                self._log(f"   → {r.new_path.name}")
+                lines.append(f"✅ {r.original_path.name}")
+                lines.append(f"   → {r.new_path.name}")
             else:
-                self._log(f"❌ {r.original_path.name}")
-                self._log(f"   {i18n.get('log.reason', reason=r.error_message)}")
+                lines.append(f"❌ {r.original_path.name}")
+                lines.append(f"   {reason_fmt.format(reason=r.error_message)}")
+
+        return lines, ok, total
+
+    def _show_preview_results(self, lines: List[str], ok: int, total: int) -> None:
+        """显示预览结果。
+
+        Args:
+            lines: 预览结果日志行
+            ok: 成功数
+            total: 总数
+        """
+        self._log_lines(lines)
 
         self.status_label.configure(
             text=i18n.get("status.preview_done", success=ok, total=total)
@@ -724,6 +992,17 @@ class MainApp(ctk.CTk):
         self.cancel_btn.configure(state="disabled", text=i18n.get("btn.cancel.cancelling"))
         self._log(i18n.get("log.cancel_requested"))
 
+    def _on_escape(self, event=None) -> None:
+        """ESC 键回调，处理中时请求取消。"""
+        if self.is_processing and not self.cancel_requested:
+            self._cancel_processing()
+
+    def _on_close(self) -> None:
+        """关闭窗口回调，请求取消并停止进程池后销毁窗口。"""
+        self.cancel_requested = True
+        self.processor.shutdown()
+        self.destroy()
+
     def _start(self) -> None:
         """开始处理。"""
         if not self.selected_files or self.is_processing:
@@ -733,48 +1012,44 @@ class MainApp(ctk.CTk):
         self._prepare_processing()
 
         total = len(self.selected_files)
-        self._log(f"\n{'='*40}")
-        self._log(i18n.get("log.process_start", count=total))
-        self._log(f"{'='*40}")
-
-        def progress_callback(
-            current: int, total_files: int, current_file: Path, result: RenameResult
-        ) -> None:
-            if self.cancel_requested:
-                return
-            progress = current / max(total_files, 1)
-            self.after(
-                0,
-                lambda: self._on_progress(
-                    current, total_files, current_file, progress, result
-                ),
-            )
+        self._log_lines([
+            f"\n{'='*40}",
+            i18n.get("log.process_start", count=total),
+            f"{'='*40}",
+        ])
+        files = [f.path for f in self.selected_files]
 
         def worker() -> None:
             try:
-                results, stats = self.processor.process_files(
-                    self.selected_files,
-                    progress_callback=progress_callback,
-                    cancel_check=lambda: self.cancel_requested,
+                # 逐个取结果交给界面显示，不在内存中保留整个批次的结果
+                stats = ProcessStats()
+                results = self.processor.iter_process_files(
+                    files, stats, cancel_check=lambda: self.cancel_requested
                 )
-                self.after(0, self._flush_pending_results)
-                self.after(0, lambda: self._on_done(results, stats))
+                for idx, result in enumerate(results, start=1):
+                    if not self.cancel_requested:
+                        self._events.put(("progress", idx, len(files), result))
+                self._events.put(("done", stats))
             except Exception as e:
-                self.after(0, lambda: self._log(i18n.get("log.process_failed", error=str(e))))
-                self.after(0, self._reset_ui)
+                self._events.put(("error", e))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._jobs.put(worker)
+        self.after(EVENT_POLL_INTERVAL_MS, self._drain_events)
 
     def _prepare_processing(self) -> None:
         """准备处理状态。"""
         self.is_processing = True
         self.cancel_requested = False
+        self._update_file_buttons()
         self._pending_results = []
-        self._last_ui_update = 0
+        self._last_ui_update = 0.0
+        self._last_progress_update = 0.0
+        # 丢弃尚未显示的文件列表，避免覆盖处理结果
+        self._file_list_gen += 1
 
-        self.files_textbox.configure(state="normal", text_color=COLORS["text"])
+        self._configure_files_textbox(state="normal", text_color=COLORS["text"])
         self.files_textbox.delete("1.0", "end")
-        self.files_textbox.configure(state="disabled")
+        self._configure_files_textbox(state="disabled")
 
         total = len(self.selected_files)
         self.progress_bar.set(0)
@@ -784,28 +1059,66 @@ class MainApp(ctk.CTk):
         self.cancel_btn.configure(state="normal", text=i18n.get("btn.cancel"))
         self.status_label.configure(text=i18n.get("status.processing", count=total))
 
+    def _drain_events(self) -> None:
+        """取走工作线程队列中的全部事件并处理，处理结束前定时重复。
+
+        一次取出的多个进度事件只把结果加入待显示列表，进度条和标签
+        只按其中最新的一个刷新。
+        """
+        latest = None
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "progress":
+                latest = event
+                self._pending_results.append((event[1], event[3]))
+            elif kind == "done":
+                self._flush_pending_results()
+                self._on_done(event[1])
+                return
+            else:
+                # 出错前已完成的结果和日志先显示出来，再报告错误
+                self._flush_pending_results()
+                self._flush_log()
+                self._log(i18n.get("log.process_failed", error=str(event[1])))
+                self._reset_ui()
+                return
+        if latest is not None:
+            _, current, total, result = latest
+            self._on_progress(current, total, result.original_path, current / max(total, 1))
+        self.after(EVENT_POLL_INTERVAL_MS, self._drain_events)
+
     def _on_progress(
         self,
         current: int,
         total: int,
         current_file: Path,
         progress: float,
-        result: RenameResult,
     ) -> None:
-        """处理进度回调。"""
-        self.progress_bar.set(progress)
-        self.progress_label.configure(
-            text=i18n.get("progress.processing", current=current, total=total)
-        )
-
-        name = current_file.name
-        display_name = name[:50] + "..." if len(name) > 50 else name
-        self.current_file_label.configure(text=display_name)
+        """刷新进度显示。
+
+        进度条、标签和结果列表都按时间节流刷新，文件处理很快时不会
+        每个文件都重绘界面。
+        """
+        now = time.monotonic()
+        if now - self._last_progress_update >= PROGRESS_UPDATE_INTERVAL or current == total:
+            self.progress_bar.set(progress)
+            self.progress_label.configure(
+                text=i18n.get("progress.processing", current=current, total=total)
+            )
 
-        self._pending_results.append((current, result))
+            name = current_file.name
+            display_name = name[:50] + "..." if len(name) > 50 else name
+            self.current_file_label.configure(text=display_name)
+            self._last_progress_update = now
 
-        now = time.time()
-        if now - self._last_ui_update > 0.3 or len(self._pending_results) >= 50:
+        if (
+            now - self._last_ui_update > RESULTS_FLUSH_INTERVAL
+            or len(self._pending_results) >= RESULTS_FLUSH_BATCH
+        ):
             self._flush_pending_results()
             self._last_ui_update = now
 
@@ -814,36 +1127,36 @@ class MainApp(ctk.CTk):
         if not self._pending_results:
             return
 
-        self.files_textbox.configure(state="normal")
-
+        # 模板每次刷新只查找一次，循环内只做格式化
+        no_change = i18n.get("log.no_change")
+        reason_fmt = i18n.get("log.reason")
+        parts = []
         for index, result in self._pending_results:
             old_name = result.original_path.name
             if result.success and result.new_path is not None:
                 new_name = result.new_path.name
                 if old_name != new_name:
-                    self.files_textbox.insert("end", f"{index:3d}. ✅ {old_name}\n")
-                    self.files_textbox.insert("end", f"     → {new_name}\n")
+                    parts.append(f"{index:3d}. ✅ {old_name}\n     → {new_name}\n")
                 else:
-                    self.files_textbox.insert(
-                        "end",
-                        f"{index:3d}. ✅ {old_name} ({i18n.get('log.no_change')})\n"
-                    )
+                    parts.append(f"{index:3d}. ✅ {old_name} ({no_change})\n")
             else:
-                self.files_textbox.insert("end", f"{index:3d}. ❌ {old_name}\n")
+                parts.append(f"{index:3d}. ❌ {old_name}\n")
                 if result.error_message:
-                    self.files_textbox.insert(
-                        "end",
-                        f"     {i18n.get('log.reason', reason=result.error_message)}\n"
+                    parts.append(
+                        f"     {reason_fmt.format(reason=result.error_message)}\n"
                     )
 
+        self._configure_files_textbox(state="normal")
+        self.files_textbox.insert("end", "".join(parts))
+        self._trim_textbox(self.files_textbox, RESULTS_MAX_LINES)
         self.files_textbox.see("end")
-        self.files_textbox.configure(state="disabled")
+        self._configure_files_textbox(state="disabled")
         self._pending_results.clear()
 
-    def _on_done(self, results: List[RenameResult], stats) -> None:
+    def _on_done(self, stats: ProcessStats) -> None:
         """处理完成回调。"""
-        ok = sum(1 for r in results if r.success)
-        total = len(results)
+        ok = stats.successful
+        total = stats.total_files
         was_cancelled = self.cancel_requested
         rate = stats.success_rate * 100
 
@@ -854,17 +1167,21 @@ class MainApp(ctk.CTk):
         self.current_file_label.configure(text="")
 
         if was_cancelled:
-            self._log(f"\n{i18n.get('log.process_cancelled')}")
-            self._log(f"   {i18n.get('log.processed_count', count=total)}")
-            self._log(f"   {i18n.get('log.success_count', success=ok, rate=f'{rate:.1f}')}")
+            self._log_lines([
+                f"\n{i18n.get('log.process_cancelled')}",
+                f"   {i18n.get('log.processed_count', count=total)}",
+                f"   {i18n.get('log.success_count', success=ok, rate=f'{rate:.1f}')}",
+            ])
             self.status_label.configure(
                 text=i18n.get("status.cancelled", total=total, success=ok)
             )
         else:
             emoji = "🎉" if rate >= 90 else ("✅" if rate >= 70 else "⚠️")
-            self._log(f"\n{i18n.get('log.process_done', emoji=emoji)}")
-            self._log(f"   {i18n.get('log.success_count', success=ok, rate=f'{rate:.1f}')} / {total}")
-            self._log(f"   {i18n.get('log.duration', time=f'{stats.duration:.1f}')}")
+            self._log_lines([
+                f"\n{i18n.get('log.process_done', emoji=emoji)}",
+                f"   {i18n.get('log.success_count', success=ok, rate=f'{rate:.1f}')} / {total}",
+                f"   {i18n.get('log.duration', time=f'{stats.duration:.1f}')}",
+            ])
             self.status_label.configure(
                 text=i18n.get("status.done", emoji=emoji, success=ok, total=total, time=f"{stats.duration:.1f}")
             )
@@ -875,6 +1192,11 @@ class MainApp(ctk.CTk):
         """重置 UI 状态。"""
         self.is_processing = False
         self.cancel_requested = False
+        self._update_file_buttons()
+        # 处理期间扫描完成加入的文件只更新了列表，这里同步文件数
+        self.file_count_label.configure(
+            text=i18n.get("panel.files.count", count=len(self.selected_files))
+        )
         self.start_btn.configure(state="normal", text=i18n.get("btn.start"))
         self.preview_btn.configure(
             state="normal" if self.selected_files else "disabled"
@@ -883,10 +1205,44 @@ class MainApp(ctk.CTk):
 
     def _log(self, msg: str) -> None:
         """写入日志。"""
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert("end", f"[{ts}] {msg}\n")
+        self._log_lines([msg])
+
+    def _log_lines(self, lines: List[str]) -> None:
+        """批量写入多行日志。
+
+        日志先进入缓冲区，LOG_FLUSH_INTERVAL_MS 内的多次写入合并为一次
+        插入和滚动。
+        """
+        ts = time.strftime("%H:%M:%S")
+        if not self._log_buffer:
+            self.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        self._log_buffer.extend(f"[{ts}] {line}\n" for line in lines)
+
+    def _flush_log(self) -> None:
+        """将缓冲的日志一次性写入日志区域。"""
+        if not self._log_buffer:
+            return
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_text.insert("end", text)
+        self._trim_textbox(self.log_text, LOG_MAX_LINES)
         self.log_text.see("end")
 
+    @staticmethod
+    def _trim_textbox(textbox: ctk.CTkTextbox, max_lines: int) -> None:
+        """行数超过上限时删除顶部的旧行。
+
+        一次删到上限的九成，之后多次追加才需要再删除一次。
+
+        Args:
+            textbox: 文本框，须处于可编辑状态
+            max_lines: 最多保留的行数
+        """
+        last_line = int(textbox.index("end-1c").split(".")[0])
+        if last_line > max_lines:
+            keep = max_lines - max_lines // 10
+            textbox.delete("1.0", f"{last_line - keep + 1}.0")
+
 
 # ============================================================
 # 入口函数
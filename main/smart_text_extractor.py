@@ -13,16 +13,39 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import functools
+import importlib
+import itertools
 import logging
+import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
 
 # 提取配置常量
 MIN_TITLE_LENGTH = 4
 MAX_TITLE_LENGTH = 120
 DEFAULT_MAX_PAGES = 2
 
+# PDF 文件头标记，规范允许其出现在文件前 1024 字节内的任意位置
+PDF_HEADER = b"%PDF-"
+PDF_HEADER_SEARCH_SIZE = 1024
+
+# 当前页已找到评分达到该值的标题时不再解析后续页面
+# （同时含中文、英文和关键词的行评分约 1.72）
+HIGH_CONFIDENCE_SCORE = 1.6
+
+# 每页最多分析的非空行数，标题通常位于页面顶部
+MAX_LINES_PER_PAGE = 50
+
+# 页面中的一行：(文本, 字号)，纯文本后端拿不到字号时为 0.0
+PageLine = Tuple[str, float]
+
 # 标题评分关键词（航空/技术文档常见词汇）
 TITLE_KEYWORDS = (
     "飞行手册",
@@ -34,6 +57,36 @@ TITLE_KEYWORDS = (
     "AFM",
 )
 
+# 全部关键词合并为一个正则，一次扫描完成匹配
+_KEYWORD_RE = re.compile("|".join(map(re.escape, TITLE_KEYWORDS)))
+
+# 未映射字形的占位符，如 "(cid:123)"，不能作为标题内容
+_CID_RE = re.compile(r"\(cid:\d+\)")
+
+# 页面文本中的非空行（从首个非空白字符到行尾，不含换行符），按需逐行
+# 匹配，不为整页创建行列表；只含空白的行不匹配，不占用每页的行数上限
+_LINE_RE = re.compile(r"\S[^\r\n\f]*")
+
+# 办公软件导出 PDF 时写入标题的程序前缀，如 "Microsoft Word - 手册.docx"
+_TOOL_PREFIX_RE = re.compile(r"(?i)^microsoft (?:word|excel|powerpoint) - ")
+
+# 标题末尾的源文件扩展名
+_FILE_EXT_RE = re.compile(r"(?i)\.(?:pdf|docx?|xlsx?|pptx?|indd|pages)$")
+
+# 软件生成的默认标题，如 "Untitled"、"Document1"，不能作为文件名
+_JUNK_TITLE_RE = re.compile(r"(?i)^(?:untitled|document|无标题|文档)[\s_-]*\d*$")
+
+# 任意语言的文字字符（排除数字和下划线），用于过滤页码、日期等纯符号行
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# 评分用的字符类型：CJK 统一汉字、ASCII 字母、数字
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+_ASCII_ALPHA_RE = re.compile(r"[A-Za-z]")
+_DIGIT_RE = re.compile(r"\d")
+
+# PDFium 不是线程安全的，同一进程内的调用需要串行
+_PDFIUM_LOCK = threading.Lock()
+
 
 @dataclass
 class ExtractedText:
@@ -56,16 +109,24 @@ class ExtractedText:
     font_size: float = 0.0
 
 
-# 延迟导入 PDF 库，避免启动时报错
-try:
-    from pypdf import PdfReader
-except ImportError:
-    PdfReader = None  # type: ignore
+@functools.lru_cache(maxsize=None)
+def _optional_import(name: str) -> Optional[ModuleType]:
+    """首次使用时导入可选的 PDF 库。
+
+    PDF 库导入开销较大（pdfplumber 会连带导入 pdfminer），延迟到真正
+    提取时再导入，启动界面和只走其中一个后端时不必付出全部导入成本。
+    未安装时返回 None，结果会被缓存。
+
+    Args:
+        name: 模块名，如 "pypdf"、"pypdfium2"、"pymupdf"、"pdfplumber"
 
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None  # type: ignore
+    Returns:
+        ModuleType: 模块对象；未安装时返回 None
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 
 class SmartTextExtractor:
@@ -104,6 +165,11 @@ class SmartTextExtractor:
         Returns:
             ExtractedText: 提取结果，包含文本和元数据；提取失败时返回 None
         """
+        # 不是 PDF 的文件（损坏、截断或扩展名错误）不交给解析库
+        if not self._has_pdf_header(pdf_path):
+            self.logger.warning("不是有效的 PDF 文件: %s", pdf_path.name)
+            return None
+
         # 策略1: 元数据
         title = self._extract_from_metadata(pdf_path)
         if title:
@@ -124,58 +190,96 @@ class SmartTextExtractor:
 
         return None
 
+    @staticmethod
+    def _has_pdf_header(pdf_path: Path) -> bool:
+        """检查文件开头是否有 PDF 文件头。
+
+        Args:
+            pdf_path: PDF 文件路径
+
+        Returns:
+            bool: 找到文件头时返回 True，文件无法读取时返回 False
+        """
+        try:
+            with open(pdf_path, "rb") as f:
+                head = f.read(PDF_HEADER_SEARCH_SIZE)
+        except OSError:
+            return False
+        return PDF_HEADER in head
+
     def _extract_from_metadata(self, pdf_path: Path) -> Optional[str]:
         """从 PDF 元数据提取标题。
 
+        优先使用 pypdfium2（C 引擎，只读取文档信息字典），未安装或
+        打开失败时退回到 pypdf。
+
         Args:
             pdf_path: PDF 文件路径
 
         Returns:
             str: 提取的标题，失败时返回 None
         """
-        if PdfReader is None:
-            return None
-
-        try:
-            reader = PdfReader(str(pdf_path))
-            candidates = self._collect_metadata_titles(reader)
-
-            for raw in candidates:
+        pdfium = _optional_import("pypdfium2")
+        if pdfium is not None:
+            try:
+                with _PDFIUM_LOCK:
+                    pdf = pdfium.PdfDocument(str(pdf_path))
+                    try:
+                        raw = pdf.get_metadata_dict().get("Title", "")
+                    finally:
+                        pdf.close()
                 cleaned = self._clean_candidate(raw)
                 if cleaned:
-                    self.logger.info(f"元数据标题: {cleaned}")
+                    self.logger.info("元数据标题: %s", cleaned)
                     return cleaned
+                return None
+            except Exception as e:
+                self.logger.debug("PDFium 读取元数据失败，改用 pypdf: %s", e)
+
+        pypdf = _optional_import("pypdf")
+        if pypdf is None:
+            return None
+
+        try:
+            # 传入文件对象而不是路径：pypdf 对路径会先把整个文件读入内存，
+            # 文件对象则按需定位读取，只解析交叉引用表和文档信息字典
+            with open(pdf_path, "rb") as f:
+                reader = pypdf.PdfReader(f, strict=False)
+                for raw in self._collect_metadata_titles(reader):
+                    cleaned = self._clean_candidate(raw)
+                    if cleaned:
+                        self.logger.info("元数据标题: %s", cleaned)
+                        return cleaned
         except Exception as e:
-            self.logger.debug(f"读取元数据失败: {e}")
+            self.logger.debug("读取元数据失败: %s", e)
 
         return None
 
-    def _collect_metadata_titles(self, reader: "PdfReader") -> List[str]:
-        """收集元数据中的标题候选。
+    def _collect_metadata_titles(self, reader: "PdfReader") -> Iterator[str]:
+        """逐个产出元数据中的标题候选。
+
+        使用生成器按优先级惰性读取，调用方拿到有效标题后即可停止，
+        不再访问后续的元数据来源。
 
         Args:
             reader: PdfReader 实例
 
-        Returns:
-            List[str]: 标题候选列表
+        Yields:
+            str: 标题候选
         """
-        candidates: List[str] = []
-
         # 尝试 metadata 属性
         meta = getattr(reader, "metadata", None)
         if meta is not None:
             title = getattr(meta, "title", None)
             if isinstance(title, str):
-                candidates.append(title)
+                yield title
 
         # 尝试 documentInfo 属性（旧版 pypdf）
         info = getattr(reader, "documentInfo", None)
         if info is not None:
             title = getattr(info, "title", None)
             if isinstance(title, str):
-                candidates.append(title)
-
-        return candidates
+                yield title
 
     def _extract_from_first_pages(
         self,
@@ -184,7 +288,9 @@ class SmartTextExtractor:
     ) -> Optional[str]:
         """从首页文本提取标题。
 
-        分析 PDF 前几页的文本内容，使用启发式算法找出最可能的标题。
+        分析 PDF 前几页的文本内容，使用启发式算法找出最可能的标题，
+        能取得字号时按行字号相对于已分析页面的最大字号加权。每页只分析
+        前 MAX_LINES_PER_PAGE 个非空行，某页已出现高置信度标题时跳过后续页面。
 
         Args:
             pdf_path: PDF 文件路径
@@ -193,37 +299,141 @@ class SmartTextExtractor:
         Returns:
             str: 提取的标题，失败时返回 None
         """
-        if pdfplumber is None:
-            return None
-
         try:
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                best_line: Optional[str] = None
-                best_score = 0.0
-
-                for page in pdf.pages[:max_pages]:
-                    text = page.extract_text() or ""
-                    for line in text.splitlines():
-                        candidate = self._clean_candidate(line)
-                        if not candidate:
-                            continue
-                        score = self._score_line(candidate)
-                        if score > best_score:
-                            best_score = score
-                            best_line = candidate
-
-                if best_line:
-                    self.logger.info(f"首页标题: {best_line}")
-                    return best_line
+            best_line: Optional[str] = None
+            best_score = 0.0
+            # 已分析页面的候选行 (文本, 字号, 未加权得分)，跨页共用同一个最大字号
+            scored: List[Tuple[str, float, float]] = []
+
+            for lines in self._iter_page_lines(pdf_path, max_pages):
+                for text, size in itertools.islice(lines, MAX_LINES_PER_PAGE):
+                    candidate = self._clean_candidate(text)
+                    if candidate:
+                        scored.append((candidate, size, self._score_line(candidate)))
+                if not scored:
+                    continue
+
+                # 有字号信息时按相对字号加权：标题通常是字号最大的行，正文中
+                # 偶然出现的关键词不会压过大字号的封面标题。最大字号取所有已
+                # 分析页面的最大值，没有标题的页面上的正文不会按满权重计分
+                max_size = max(size for _, size, _ in scored)
+                best_line, best_score = None, 0.0
+                for candidate, size, score in scored:
+                    if max_size > 0:
+                        score *= size / max_size
+                    if score > best_score:
+                        best_score = score
+                        best_line = candidate
+                if best_score >= HIGH_CONFIDENCE_SCORE:
+                    break
+
+            if best_line:
+                self.logger.info("首页标题: %s", best_line)
+                return best_line
         except Exception as e:
-            self.logger.warning(f"首页提取失败: {e}")
+            self.logger.warning("首页提取失败: %s", e)
 
         return None
 
+    def _iter_page_lines(self, pdf_path: Path, max_pages: int) -> Iterator[Iterable[PageLine]]:
+        """逐页产出前几页的文本行及其字号。
+
+        优先使用 PyMuPDF（C 引擎，速度快一个数量级），从结构化结果中
+        一次取得每行的文本和字号；未安装时退回到其他后端的纯文本，
+        字号记为 0.0。
+
+        Args:
+            pdf_path: PDF 文件路径
+            max_pages: 最大读取页数
+
+        Yields:
+            Iterable[PageLine]: 单页中按从上到下顺序排列的非空行 (文本, 字号)
+        """
+        pymupdf = _optional_import("pymupdf")
+        if pymupdf is not None:
+            with pymupdf.open(pdf_path) as doc:
+                for page in doc.pages(0, min(max_pages, doc.page_count)):
+                    # TEXTFLAGS_TEXT 不含图片，避免把页面图片数据一并解码
+                    data = page.get_text("dict", flags=pymupdf.TEXTFLAGS_TEXT, sort=True)
+                    yield self._dict_page_lines(data)
+            return
+
+        for text in self._iter_page_texts(pdf_path, max_pages):
+            yield ((m.group(), 0.0) for m in _LINE_RE.finditer(text))
+
+    @staticmethod
+    def _dict_page_lines(data: dict) -> Iterator[PageLine]:
+        """将 PyMuPDF 的 "dict" 结果展开为文本行。
+
+        Args:
+            data: page.get_text("dict") 的返回值
+
+        Yields:
+            PageLine: (行文本, 行内最大字号)，跳过只含空白的行
+        """
+        for block in data.get("blocks", ()):
+            for line in block.get("lines", ()):
+                spans = line.get("spans", ())
+                if spans:
+                    text = "".join(span["text"] for span in spans)
+                    if text and not text.isspace():
+                        yield text, max(span["size"] for span in spans)
+
+    def _iter_page_texts(self, pdf_path: Path, max_pages: int) -> Iterator[str]:
+        """逐页产出前几页的纯文本。
+
+        依次尝试 pypdfium2（C 引擎）、pypdf 和 pdfplumber（基于 pdfminer，
+        三者中最慢），使用第一个已安装的库。
+
+        Args:
+            pdf_path: PDF 文件路径
+            max_pages: 最大读取页数
+
+        Yields:
+            str: 单页文本
+        """
+        pdfium = _optional_import("pypdfium2")
+        if pdfium is not None:
+            # 只在调用 PDFium 时持锁，产出文本期间不占用锁
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                for index in range(min(max_pages, len(pdf))):
+                    with _PDFIUM_LOCK:
+                        page = pdf[index]
+                        textpage = page.get_textpage()
+                        text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                    yield text
+            finally:
+                with _PDFIUM_LOCK:
+                    pdf.close()
+            return
+
+        pypdf = _optional_import("pypdf")
+        if pypdf is not None:
+            with open(pdf_path, "rb") as f:
+                reader = pypdf.PdfReader(f, strict=False)
+                for page in itertools.islice(reader.pages, max_pages):
+                    yield page.extract_text() or ""
+            return
+
+        pdfplumber = _optional_import("pdfplumber")
+        if pdfplumber is None:
+            return
+
+        # 只解析需要的页（页码从 1 开始），避免为整本文档创建页面对象
+        with pdfplumber.open(str(pdf_path), pages=list(range(1, max_pages + 1))) as pdf:
+            for page in pdf.pages:
+                yield page.extract_text() or ""
+
     def _clean_candidate(self, text: str) -> str:
         """清理候选文本。
 
-        移除无效字符，检查长度是否在有效范围内。
+        移除无效字符、未映射字形占位符、导出程序前缀和文件扩展名，
+        检查长度是否在有效范围内，并拒绝软件默认标题和不含任何文字的
+        文本。廉价的检查放在前面。
 
         Args:
             text: 原始文本
@@ -231,17 +441,31 @@ class SmartTextExtractor:
         Returns:
             str: 清理后的文本，无效时返回空字符串
         """
-        if not text:
+        # 后续清理只会缩短文本，过短的原文可直接拒绝
+        if not text or len(text) < MIN_TITLE_LENGTH:
             return ""
 
         s = text.strip().replace("\u0000", "")
 
+        # 移除未映射字形占位符
+        if "(cid:" in s:
+            s = _CID_RE.sub("", s).strip()
+
         # 去除首尾括号
         if s.startswith("(") and s.endswith(")"):
             s = s[1:-1].strip()
 
+        # 去除导出程序前缀和文件扩展名，拒绝软件默认标题
+        s = _FILE_EXT_RE.sub("", _TOOL_PREFIX_RE.sub("", s)).strip()
+        if _JUNK_TITLE_RE.match(s):
+            return ""
+
         # 长度检查
-        if len(s) < MIN_TITLE_LENGTH or len(s) > MAX_TITLE_LENGTH:
+        if not MIN_TITLE_LENGTH <= len(s) <= MAX_TITLE_LENGTH:
+            return ""
+
+        # 不含任何文字的行（页码、日期、分隔线）不是标题
+        if not _LETTER_RE.search(s):
             return ""
 
         return s
@@ -267,9 +491,9 @@ class SmartTextExtractor:
             score *= 0.7
 
         # 字符类型因素
-        has_cjk = any("\u4e00" <= c <= "\u9fff" for c in text)
-        has_alpha = any(c.isalpha() and c.isascii() for c in text)
-        has_digit = any(c.isdigit() for c in text)
+        has_cjk = _CJK_RE.search(text) is not None
+        has_alpha = _ASCII_ALPHA_RE.search(text) is not None
+        has_digit = _DIGIT_RE.search(text) is not None
 
         if has_cjk:
             score *= 1.2
@@ -279,7 +503,7 @@ class SmartTextExtractor:
             score *= 1.05
 
         # 关键词加分
-        if any(kw in text for kw in TITLE_KEYWORDS):
+        if _KEYWORD_RE.search(text):
             score *= 1.3
 
         return score
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""标题缓存模块
+
+将 PDF 标题提取结果持久化到 JSON 文件，文件未发生变化时直接复用
+上次的提取结果，避免重复解析 PDF。
+
+Copyright (c) 2024-2026 虎哥
+Licensed under the MIT License.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .smart_text_extractor import ExtractedText
+from .utils import json_dumps, json_loads
+
+# 缓存文件路径
+CACHE_FILE = Path.home() / ".cache" / "tiger_pdf_renamer.json"
+
+# 缓存格式及标题提取规则的版本，修改提取或评分逻辑后递增，旧缓存整体失效
+CACHE_VERSION = 2
+
+# 最多保留的缓存条目数，超出时淘汰最早写入的条目
+CACHE_MAX_ENTRIES = 10000
+
+# 每新增多少条目写盘一次，批量处理中断时已提取的结果不会丢失
+CACHE_FLUSH_INTERVAL = 50
+
+# 内容指纹读取的头部/尾部字节数
+FINGERPRINT_CHUNK_SIZE = 64 * 1024
+
+
+class TitleCache:
+    """标题提取结果缓存。
+
+    以文件内容指纹作为键，与路径无关：文件重命名、移动或批次中出现重复
+    副本时都能命中，内容变化后键随之变化，旧条目自然失效。缓存文件在
+    首次访问时加载，每新增 CACHE_FLUSH_INTERVAL 条写盘一次，调用 save()
+    时写回剩余变更。缓存文件记录 CACHE_VERSION，版本不一致时整体丢弃，
+    提取规则更新后不会继续使用旧规则的结果。
+
+    Attributes:
+        cache_file: 缓存文件路径
+
+    Example:
+        >>> cache = TitleCache()
+        >>> key = cache.make_key(Path("doc.pdf"))
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        """初始化缓存。
+
+        Args:
+            cache_file: 缓存文件路径，默认为 ~/.cache/tiger_pdf_renamer.json
+        """
+        self.cache_file = cache_file or CACHE_FILE
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._unsaved = 0
+
+    @staticmethod
+    def make_key(file_path: Path) -> Optional[str]:
+        """生成文件的缓存键（内容指纹）。
+
+        对文件大小、头部和尾部各 64 KiB 计算 BLAKE2b-128 摘要，不读取
+        整个文件。PDF 的增量更新和元数据修改都会改变文件尾部或大小，
+        仅中间字节不同而大小相同的文件会被视为同一文件。
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            str: 缓存键；文件无法访问时返回 None
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                digest.update(size.to_bytes(8, "little"))
+                digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+                if size > FINGERPRINT_CHUNK_SIZE:
+                    f.seek(max(size - FINGERPRINT_CHUNK_SIZE, FINGERPRINT_CHUNK_SIZE))
+                    digest.update(f.read())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def __contains__(self, key: Optional[str]) -> bool:
+        """判断缓存中是否有该键，不构造提取结果对象。
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            bool: 缓存命中时返回 True
+        """
+        return key is not None and key in self._load()
+
+    def get(self, key: Optional[str]) -> Optional[ExtractedText]:
+        """查询缓存。
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            ExtractedText: 缓存的提取结果；未命中时返回 None
+        """
+        if key is None:
+            return None
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        try:
+            data = dict(entry)
+            data["position"] = tuple(data.get("position", (0.0, 0.0)))
+            return ExtractedText(**data)
+        except TypeError:
+            return None
+
+    def put(self, key: Optional[str], extracted: ExtractedText) -> None:
+        """写入缓存。
+
+        Args:
+            key: 缓存键，为 None 时忽略
+            extracted: 提取结果
+        """
+        if key is None:
+            return
+        entries = self._load()
+        entries.pop(key, None)
+        entries[key] = asdict(extracted)
+        while len(entries) > CACHE_MAX_ENTRIES:
+            del entries[next(iter(entries))]
+        self._unsaved += 1
+        if self._unsaved >= CACHE_FLUSH_INTERVAL:
+            self.save()
+
+    def save(self) -> bool:
+        """将缓存写回文件，没有变化时不写入。
+
+        先写入同目录下的临时文件再替换原文件，写入中途退出不会留下
+        不完整的缓存文件。
+
+        Returns:
+            bool: 保存是否成功
+        """
+        if not self._unsaved or self._entries is None:
+            return True
+        tmp_path: Optional[str] = None
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=self.cache_file.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_dumps(
+                    {"version": CACHE_VERSION, "entries": self._entries}
+                ))
+            os.replace(tmp_path, self.cache_file)
+            tmp_path = None
+            self._unsaved = 0
+            return True
+        except (OSError, TypeError):
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """加载缓存文件，只在首次访问时读取。
+
+        文件损坏或版本与 CACHE_VERSION 不一致时从空缓存开始。
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 缓存条目字典
+        """
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_file, "rb") as f:
+                    data = json_loads(f.read())
+                if (
+                    isinstance(data, dict)
+                    and data.get("version") == CACHE_VERSION
+                    and isinstance(data.get("entries"), dict)
+                ):
+                    self._entries = data["entries"]
+            except (OSError, ValueError):
+                pass
+        return self._entries
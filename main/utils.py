@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """通用工具模块
 
-提供日志配置等基础功能，支持日志文件按日期轮转。
+提供日志配置、JSON 读写等基础功能，支持日志文件按日期轮转。
 
 Copyright (c) 2024-2026 虎哥
 Licensed under the MIT License.
@@ -12,10 +12,20 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Optional, Tuple
+
+# 可选的 orjson 加速 JSON 读写，未安装时使用标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 # 日志配置常量
 LOG_DIR_NAME = "logs"
@@ -23,6 +33,10 @@ LOG_PREFIX = "tiger_pdf_renamer"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# 后台写日志的监听线程，主进程和工作进程的日志都由它写入；
+# 重新配置或进程退出时停止并写完剩余记录
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     prefix: str = LOG_PREFIX,
@@ -31,6 +45,10 @@ def setup_logging(
     """设置日志系统。
 
     配置文件日志和控制台日志，日志文件按日期命名，存放在项目根目录的 logs/ 文件夹中。
+    logger 只挂一个 QueueHandler，写文件和控制台由后台线程完成，记录日志的
+    线程不会等待磁盘写入。进程池工作进程的日志记录随提取结果返回主进程，
+    再交给同一个 logger（见 file_processor._extract_in_worker），同样经
+    这个队列和监听线程写入。
 
     Args:
         prefix: 日志文件名前缀，默认为 "tiger_pdf_renamer"
@@ -57,6 +75,12 @@ def setup_logging(
         return logger, str(log_file)
 
     # 清理旧处理器并重新配置
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
     logger.handlers.clear()
     logger.setLevel(logging.INFO)
 
@@ -66,16 +90,67 @@ def setup_logging(
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # 控制台处理器
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # 记录先放入队列，由监听线程交给文件和控制台处理器
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
 
     if force_new:
-        logger.info(f"日志文件: {log_file}")
+        logger.info("日志文件: %s", log_file)
         logger.info("日志系统初始化完成")
 
     return logger, str(log_file)
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """进程退出时停止监听线程，确保队列中的日志写入文件。"""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+def json_loads(data: bytes) -> Any:
+    """解析 UTF-8 编码的 JSON 数据。
+
+    安装了 orjson 时使用 orjson，否则使用标准库 json。
+
+    Args:
+        data: JSON 字节串
+
+    Returns:
+        Any: 解析结果
+
+    Raises:
+        ValueError: JSON 格式错误
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """将对象序列化为缩进 2 格的 UTF-8 JSON 数据。
+
+    非 ASCII 字符原样输出，不做转义。
+
+    Args:
+        obj: 待序列化的对象
+
+    Returns:
+        bytes: JSON 字节串
+
+    Raises:
+        TypeError: 对象包含无法序列化的类型
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
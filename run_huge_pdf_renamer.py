@@ -17,6 +17,7 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -29,4 +30,6 @@ from main.pdf_renamer import main
 
 
 if __name__ == "__main__":
+    # 打包为 exe 后，进程池的子进程需要由此入口接管
+    multiprocessing.freeze_support()
     main()
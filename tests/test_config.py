@@ -10,7 +10,7 @@ Validates: Requirements 2.1, 2.2, 2.4
 
 import json
 import pytest
-import tempfile
+import uuid
 from pathlib import Path
 from hypothesis import given, strategies as st, settings
 
@@ -19,7 +19,21 @@ import sys
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from main.config import RenameConfig, ConfigManager, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from main.config import (
+    RenameConfig, ConfigManager, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE,
+    _dump_config, _load_config_data,
+)
+
+
+@pytest.fixture(scope="module")
+def cfg_dir(tmp_path_factory):
+    """整个模块共用的临时目录，各测试使用不同的文件名"""
+    return tmp_path_factory.mktemp("cfg")
+
+
+def _new_config_file(cfg_dir: Path) -> Path:
+    """在共用目录中生成一个不重复的配置文件路径"""
+    return cfg_dir / f"{uuid.uuid4().hex}.json"
 
 
 class TestRenameConfig:
@@ -31,7 +45,9 @@ class TestRenameConfig:
         assert config.max_filename_length == 120
         assert config.add_timestamp is False
         assert config.auto_backup is False
+        assert config.backup_use_hardlink is False
         assert config.parallel_processing is True
+        assert config.recursive_scan is False
         assert config.max_workers == 4
         assert config.language == DEFAULT_LANGUAGE
 
@@ -61,103 +77,92 @@ class TestRenameConfig:
 class TestConfigManagerLanguage:
     """ConfigManager 语言设置测试"""
 
-    def test_save_and_load_language(self):
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_save_and_load_language(self, cfg_dir, lang):
         """测试保存和加载语言设置"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            
-            # 创建配置管理器并设置语言
-            manager = ConfigManager.__new__(ConfigManager)
-            manager.config_file = config_file
-            manager.config = RenameConfig(language="en_US")
-            manager.save_config()
-            
-            # 验证文件内容
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            assert data["language"] == "en_US"
-            
-            # 重新加载
-            manager2 = ConfigManager.__new__(ConfigManager)
-            manager2.config_file = config_file
-            manager2.config = manager2._load_config()
-            assert manager2.config.language == "en_US"
-
-    def test_update_language(self):
+        config_file = _new_config_file(cfg_dir)
+
+        # 创建配置管理器并设置语言
+        manager = ConfigManager(config_file, RenameConfig(language=lang))
+        manager.save_config()
+
+        # 验证文件内容
+        with open(config_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["language"] == lang
+
+        # 重新加载
+        manager2 = ConfigManager(config_file)
+        assert manager2.config.language == lang
+
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_update_language(self, cfg_dir, lang):
         """测试更新语言设置"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            
-            manager = ConfigManager.__new__(ConfigManager)
-            manager.config_file = config_file
-            manager.config = RenameConfig()
-            
-            # 更新语言
-            success = manager.update_config(language="en_US")
-            assert success is True
-            assert manager.config.language == "en_US"
-            
-            # 验证文件已更新
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            assert data["language"] == "en_US"
-
-    def test_missing_language_uses_default(self):
+        config_file = _new_config_file(cfg_dir)
+        start = next(code for code in SUPPORTED_LANGUAGES if code != lang)
+
+        manager = ConfigManager(config_file, RenameConfig(language=start))
+
+        # 更新语言
+        success = manager.update_config(language=lang)
+        assert success is True
+        assert manager.config.language == lang
+
+        # 验证文件已更新
+        with open(config_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["language"] == lang
+
+    def test_update_unchanged_skips_save(self, cfg_dir):
+        """测试配置没有变化时不写文件"""
+        config_file = _new_config_file(cfg_dir)
+
+        manager = ConfigManager(config_file, RenameConfig())
+
+        assert manager.update_config(language=DEFAULT_LANGUAGE) is True
+        assert not config_file.exists()
+
+    def test_missing_language_uses_default(self, cfg_dir):
         """测试缺少语言字段时使用默认值"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            
-            # 创建不包含 language 字段的配置文件（模拟旧版本配置）
-            old_config = {
-                "max_filename_length": 100,
-                "add_timestamp": True
-            }
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(old_config, f)
-            
-            # 加载配置
-            manager = ConfigManager.__new__(ConfigManager)
-            manager.config_file = config_file
-            manager.config = manager._load_config()
-            
-            # 应该使用默认语言
-            assert manager.config.language == DEFAULT_LANGUAGE
+        config_file = _new_config_file(cfg_dir)
+
+        # 创建不包含 language 字段的配置文件（模拟旧版本配置）
+        old_config = {
+            "max_filename_length": 100,
+            "add_timestamp": True
+        }
+        with open(config_file, "w", encoding="utf-8") as f:
+            json.dump(old_config, f)
+
+        # 加载配置
+        manager = ConfigManager(config_file)
+
+        # 应该使用默认语言
+        assert manager.config.language == DEFAULT_LANGUAGE
 
 
 class TestConfigRoundTrip:
     """配置持久化 Round-Trip 属性测试
-    
+
+    只验证序列化和解析，不访问文件系统；读写文件由
+    TestConfigManagerLanguage 覆盖。
+
     Feature: internationalization, Property 3: Configuration Round-Trip
     Validates: Requirements 2.1, 2.2, 2.4
     """
 
-    @given(st.sampled_from(SUPPORTED_LANGUAGES))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("lang_code", SUPPORTED_LANGUAGES)
     def test_language_round_trip(self, lang_code: str):
         """Property 3: 语言设置的 Round-Trip 测试
-        
+
         Feature: internationalization, Property 3: Configuration Round-Trip
         Validates: Requirements 2.1, 2.2, 2.4
-        
-        For any valid language code, saving it to the configuration and then
-        loading a new ConfigManager instance SHALL return the same language code.
+
+        For any valid language code, serializing it with the configuration and
+        parsing it back SHALL return the same language code.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            
-            # 保存配置
-            manager1 = ConfigManager.__new__(ConfigManager)
-            manager1.config_file = config_file
-            manager1.config = RenameConfig(language=lang_code)
-            manager1.save_config()
-            
-            # 加载配置
-            manager2 = ConfigManager.__new__(ConfigManager)
-            manager2.config_file = config_file
-            manager2.config = manager2._load_config()
-            
-            # 验证 round-trip
-            assert manager2.config.language == lang_code
+        data = _dump_config(RenameConfig(language=lang_code))
+        assert _load_config_data(data).language == lang_code
 
     @given(
         st.integers(min_value=10, max_value=255),
@@ -178,41 +183,19 @@ class TestConfigRoundTrip:
         lang: str
     ):
         """Property 3: 完整配置的 Round-Trip 测试
-        
+
         Feature: internationalization, Property 3: Configuration Round-Trip
         Validates: Requirements 2.1, 2.2, 2.4
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            
-            # 创建配置
-            original = RenameConfig(
-                max_filename_length=max_len,
-                add_timestamp=add_ts,
-                auto_backup=backup,
-                parallel_processing=parallel,
-                max_workers=workers,
-                language=lang
-            )
-            
-            # 保存
-            manager1 = ConfigManager.__new__(ConfigManager)
-            manager1.config_file = config_file
-            manager1.config = original
-            manager1.save_config()
-            
-            # 加载
-            manager2 = ConfigManager.__new__(ConfigManager)
-            manager2.config_file = config_file
-            manager2.config = manager2._load_config()
-            
-            # 验证所有字段
-            assert manager2.config.max_filename_length == max_len
-            assert manager2.config.add_timestamp == add_ts
-            assert manager2.config.auto_backup == backup
-            assert manager2.config.parallel_processing == parallel
-            assert manager2.config.max_workers == workers
-            assert manager2.config.language == lang
+        original = RenameConfig(
+            max_filename_length=max_len,
+            add_timestamp=add_ts,
+            auto_backup=backup,
+            parallel_processing=parallel,
+            max_workers=workers,
+            language=lang
+        )
+        assert _load_config_data(_dump_config(original)) == original
 
 
 if __name__ == "__main__":
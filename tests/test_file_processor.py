@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""FileProcessor 测试模块
+
+验证文件名清理、冲突处理、备份和批量处理逻辑，不依赖真实 PDF 文件。
+"""
+
+import pytest
+
+import logging
+import os
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main.config import RenameConfig
+from main.file_processor import (
+    BACKUP_DIR_NAME, SUBMIT_AHEAD_PER_WORKER, WORKER_LOGGER_NAME, FileProcessor,
+    ProcessStats, _copy_file, scan_pdf_files,
+)
+from main.smart_text_extractor import ExtractedText
+from main.title_cache import TitleCache
+
+
+def _make_processor(tmp_path, **options):
+    """创建使用临时缓存和独立配置的顺序处理器，不读写用户目录和项目配置"""
+    options.setdefault("parallel_processing", False)
+    return FileProcessor(
+        config=RenameConfig(**options), title_cache=TitleCache(tmp_path / "cache.json")
+    )
+
+
+class TestCleanFilename:
+    """文件名清理测试"""
+
+    @pytest.fixture(autouse=True)
+    def setup_processor(self, tmp_path):
+        """每个测试前创建处理器"""
+        self.processor = _make_processor(tmp_path)
+
+    def test_clean_title_unchanged(self):
+        """测试已是合法文件名的标题原样返回"""
+        assert self.processor._clean_filename(" 飞行手册 第一卷 ") == "飞行手册 第一卷"
+
+    def test_removes_illegal_chars(self):
+        """测试移除 Windows 文件名非法字符"""
+        assert self.processor._clean_filename('A<B>C:D"E/F\\G|H?I*J') == "ABCDEFGHIJ"
+
+    def test_collapses_spaces(self):
+        """测试合并连续空格"""
+        assert self.processor._clean_filename("Flight    Manual  Part 1") == "Flight Manual Part 1"
+
+    def test_strips_dots_and_spaces(self):
+        """测试去除首尾点和空格"""
+        assert self.processor._clean_filename("  ..Manual.. ") == "Manual"
+
+    def test_empty_after_cleaning(self):
+        """测试只含非法字符时返回空字符串"""
+        assert self.processor._clean_filename("  ?*<> ") == ""
+
+    def test_truncates_long_name(self):
+        """测试过长文件名被截断"""
+        max_len = self.processor.config.max_filename_length
+        name = self.processor._clean_filename("x" * (max_len + 10))
+        assert len(name) == max_len
+        assert name.endswith("...")
+
+
+class TestResolveConflict:
+    """文件名冲突处理测试"""
+
+    @pytest.fixture(autouse=True)
+    def setup_processor(self, tmp_path):
+        """每个测试前创建处理器"""
+        self.processor = _make_processor(tmp_path)
+
+    def test_free_target(self, tmp_path):
+        """测试目标不存在时直接使用"""
+        original = tmp_path / "a.pdf"
+        original.touch()
+        target = tmp_path / "Manual.pdf"
+        assert self.processor._resolve_conflict(target, original) == target
+
+    def test_adds_numeric_suffix(self, tmp_path):
+        """测试目标已存在时添加数字后缀"""
+        original = tmp_path / "a.pdf"
+        original.touch()
+        (tmp_path / "Manual.pdf").touch()
+        (tmp_path / "Manual_1.pdf").touch()
+        result = self.processor._resolve_conflict(tmp_path / "Manual.pdf", original)
+        assert result == tmp_path / "Manual_2.pdf"
+
+    def test_keeps_existing_suffixed_name(self, tmp_path):
+        """测试已带后缀的文件重复处理时保持原名"""
+        (tmp_path / "Manual.pdf").touch()
+        original = tmp_path / "Manual_1.pdf"
+        original.touch()
+        result = self.processor._resolve_conflict(tmp_path / "Manual.pdf", original)
+        assert result == original
+
+    def test_case_variant_is_conflict(self, tmp_path):
+        """测试仅大小写不同的已有文件视为冲突"""
+        original = tmp_path / "a.pdf"
+        original.touch()
+        (tmp_path / "MANUAL.pdf").touch()
+        result = self.processor._resolve_conflict(tmp_path / "Manual.pdf", original)
+        assert result == tmp_path / "Manual_1.pdf"
+
+    def test_snapshot_tracks_renames(self, tmp_path):
+        """测试重命名后快照同步更新"""
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        first.touch()
+        second.touch()
+        target = self.processor._resolve_conflict(tmp_path / "Manual.pdf", first)
+        first.rename(target)
+        self.processor._record_rename(first, target)
+        result = self.processor._resolve_conflict(tmp_path / "Manual.pdf", second)
+        assert result == tmp_path / "Manual_1.pdf"
+        assert self.processor._resolve_conflict(tmp_path / "a.pdf", second) == tmp_path / "a.pdf"
+
+
+class TestScanPdfFiles:
+    """文件夹扫描测试"""
+
+    def _make_tree(self, tmp_path):
+        """创建包含子文件夹和备份目录的文件树"""
+        (tmp_path / "b.PDF").write_bytes(b"12345")
+        (tmp_path / "a.pdf").write_bytes(b"1")
+        (tmp_path / "notes.txt").write_bytes(b"x")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.pdf").write_bytes(b"12")
+        (tmp_path / BACKUP_DIR_NAME).mkdir()
+        (tmp_path / BACKUP_DIR_NAME / "a_20240101_000000.pdf").write_bytes(b"1")
+
+    def test_top_level_only(self, tmp_path):
+        """测试默认只扫描顶层，扩展名不区分大小写并带上文件大小"""
+        self._make_tree(tmp_path)
+        assert scan_pdf_files(tmp_path) == [
+            (tmp_path / "a.pdf", 1),
+            (tmp_path / "b.PDF", 5),
+        ]
+
+    def test_recursive_skips_backup(self, tmp_path):
+        """测试递归扫描包含子文件夹并跳过备份目录"""
+        self._make_tree(tmp_path)
+        paths = [p for p, _ in scan_pdf_files(tmp_path, recursive=True)]
+        assert paths == [tmp_path / "a.pdf", tmp_path / "b.PDF", tmp_path / "sub" / "c.pdf"]
+
+    def test_missing_folder_raises(self, tmp_path):
+        """测试顶层文件夹不存在时抛出 OSError"""
+        with pytest.raises(OSError):
+            scan_pdf_files(tmp_path / "missing")
+
+
+class TestCopyFile:
+    """备份复制测试"""
+
+    def _make_source(self, tmp_path):
+        """创建带固定修改时间的源文件"""
+        src = tmp_path / "src.pdf"
+        src.write_bytes(os.urandom(200_000))
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        return src
+
+    def test_copies_content_and_mtime(self, tmp_path):
+        """测试复制内容并保留修改时间"""
+        src = self._make_source(tmp_path)
+        dst = tmp_path / "dst.pdf"
+        _copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_falls_back_when_copy_range_fails(self, tmp_path, monkeypatch):
+        """测试 copy_file_range 失败时退回常规复制"""
+        def fail(*args):
+            raise OSError("not supported")
+
+        monkeypatch.setattr(os, "copy_file_range", fail, raising=False)
+        src = self._make_source(tmp_path)
+        dst = tmp_path / "dst.pdf"
+        _copy_file(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+
+class TestCreateBackup:
+    """备份创建测试"""
+
+    @pytest.fixture(autouse=True)
+    def setup_processor(self, tmp_path):
+        """每个测试前创建处理器"""
+        self.processor = _make_processor(tmp_path)
+
+    def test_copy_backup_by_default(self, tmp_path):
+        """测试默认备份为独立副本"""
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        backup = self.processor._create_backup(src)
+        assert backup.parent == tmp_path / BACKUP_DIR_NAME
+        assert backup.read_bytes() == src.read_bytes()
+        assert not backup.samefile(src)
+
+    def test_hardlink_backup(self, tmp_path):
+        """测试启用硬链接时备份与原文件共享数据"""
+        self.processor.config.backup_use_hardlink = True
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        backup = self.processor._create_backup(src)
+        assert backup.samefile(src)
+
+    def test_hardlink_falls_back_to_copy(self, tmp_path, monkeypatch):
+        """测试无法创建硬链接时退回复制"""
+        self.processor.config.backup_use_hardlink = True
+        monkeypatch.setattr(FileProcessor, "_link_file", staticmethod(lambda s, d: False))
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        backup = self.processor._create_backup(src)
+        assert backup.read_bytes() == src.read_bytes()
+        assert not backup.samefile(src)
+
+
+class TestIterProcessFiles:
+    """逐个产出结果的批量处理测试"""
+
+    def _make_files(self, tmp_path, count):
+        """创建无法提取标题的文件"""
+        files = []
+        for i in range(count):
+            path = tmp_path / f"broken{i}.pdf"
+            path.write_bytes(f"not a pdf {i}".encode())
+            files.append(path)
+        return files
+
+    def test_yields_each_result(self, tmp_path):
+        """测试逐个产出结果并更新统计"""
+        processor = _make_processor(tmp_path)
+        files = self._make_files(tmp_path, 3)
+        stats = ProcessStats()
+        results = list(processor.iter_process_files(files, stats))
+        assert [r.original_path for r in results] == files
+        assert stats.failed == 3
+        assert stats.total_files == 3
+        assert stats.end_time is not None
+
+    def test_cancel_stops_early(self, tmp_path):
+        """测试取消后停止处理，统计只计已处理文件"""
+        processor = _make_processor(tmp_path)
+        files = self._make_files(tmp_path, 3)
+        stats = ProcessStats()
+        seen = []
+        for result in processor.iter_process_files(
+            files, stats, cancel_check=lambda: len(seen) >= 1
+        ):
+            seen.append(result)
+        assert len(seen) == 1
+        assert stats.total_files == 1
+
+    def test_dry_run_leaves_files(self, tmp_path):
+        """测试预览模式只计算目标文件名，不备份也不重命名"""
+        processor = _make_processor(tmp_path, auto_backup=True)
+        files = []
+        for i in range(2):
+            path = tmp_path / f"doc{i}.pdf"
+            path.write_bytes(f"%PDF-1.4 {i}".encode())
+            processor.title_cache.put(
+                processor.title_cache.make_key(path),
+                ExtractedText(text="Flight Manual", confidence=0.9, strategy="metadata"),
+            )
+            files.append(path)
+        results, stats = processor.process_files(files, dry_run=True)
+        assert [r.new_path.name for r in results] == ["Flight Manual.pdf", "Flight Manual_1.pdf"]
+        assert all(r.backup_path is None for r in results)
+        assert stats.successful == 2
+        assert all(f.exists() for f in files)
+        assert not (tmp_path / "Flight Manual.pdf").exists()
+        assert not (tmp_path / BACKUP_DIR_NAME).exists()
+
+    def test_parallel_submits_bounded_window(self, tmp_path, monkeypatch):
+        """测试并行模式只提前提交有限个任务，批次结束后关闭进程池"""
+        processor = _make_processor(tmp_path)
+        executor = _FakeExecutor()
+        monkeypatch.setattr(processor, "_worker_count", lambda count: 2)
+        monkeypatch.setattr(processor, "_create_executor", lambda workers: executor)
+        files = self._make_files(tmp_path, 10)
+        for done, _ in enumerate(
+            processor.iter_process_files(files, ProcessStats()), start=1
+        ):
+            assert len(executor.submitted) <= done + SUBMIT_AHEAD_PER_WORKER * 2
+        assert executor.submitted == files
+        assert executor.shut_down
+        assert processor._executor is None
+
+    def test_shutdown_between_refills(self, tmp_path, monkeypatch):
+        """测试补充窗口时其他线程调用 shutdown 不抛出异常，剩余文件仍有结果"""
+        processor = _make_processor(tmp_path)
+        executor = _FakeExecutor()
+        monkeypatch.setattr(processor, "_worker_count", lambda count: 2)
+        monkeypatch.setattr(processor, "_create_executor", lambda workers: executor)
+        submit = executor.submit
+
+        def racing_submit(fn, file_path):
+            # 关闭窗口的线程恰好在本线程读取进程池之后调用 shutdown
+            if len(executor.submitted) == SUBMIT_AHEAD_PER_WORKER * 2 + 1:
+                processor.shutdown()
+            return submit(fn, file_path)
+
+        monkeypatch.setattr(executor, "submit", racing_submit)
+        files = self._make_files(tmp_path, 10)
+        results = list(processor.iter_process_files(files, ProcessStats()))
+        assert [r.original_path for r in results] == files
+        assert len(executor.submitted) == SUBMIT_AHEAD_PER_WORKER * 2 + 1
+        assert executor.shut_down
+
+    def test_broken_pool_falls_back_to_serial(self, tmp_path, monkeypatch):
+        """测试工作进程崩溃时只有当前文件失败，其余文件改为顺序提取"""
+        processor = _make_processor(tmp_path)
+        executor = _FakeExecutor(BrokenProcessPool("worker died"))
+        monkeypatch.setattr(processor, "_worker_count", lambda count: 2)
+        monkeypatch.setattr(processor, "_create_executor", lambda workers: executor)
+        extracted = []
+        monkeypatch.setattr(
+            processor.text_extractor, "extract_title",
+            lambda path: extracted.append(path) or ExtractedText(
+                text=path.stem.upper(), confidence=0.9, strategy="metadata"
+            ),
+        )
+        files = self._make_files(tmp_path, 6)
+        results, stats = processor.process_files(files, dry_run=True)
+        assert not results[0].success
+        assert all(r.success for r in results[1:])
+        assert extracted == files[1:]
+        assert executor.shut_down
+        assert len(executor.submitted) < len(files)
+
+    def test_worker_logs_reach_app_logger(self, tmp_path, monkeypatch, caplog):
+        """测试工作进程中的提取警告写入主进程的应用日志"""
+        processor = _make_processor(tmp_path)
+        processor.logger = logging.getLogger("tiger_pdf_renamer.test")
+        monkeypatch.setattr(processor, "_worker_count", lambda count: 2)
+        files = self._make_files(tmp_path, 2)
+        with caplog.at_level(logging.INFO):
+            results, _ = processor.process_files(files)
+        assert not any(r.success for r in results)
+        warnings = [
+            r for r in caplog.records
+            if r.name == WORKER_LOGGER_NAME and r.levelno == logging.WARNING
+        ]
+        assert sorted(r.getMessage() for r in warnings) == [
+            f"不是有效的 PDF 文件: {f.name}" for f in files
+        ]
+        assert all(r.process != os.getpid() for r in warnings)
+
+
+class _FakeExecutor:
+    """记录提交顺序的进程池替身，任务立即完成，无结果或以指定异常失败"""
+
+    def __init__(self, error=None):
+        self.submitted = []
+        self.shut_down = False
+        self.error = error
+
+    def submit(self, fn, file_path):
+        if self.shut_down:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        self.submitted.append(file_path)
+        future = Future()
+        if self.error is not None:
+            future.set_exception(self.error)
+        else:
+            future.set_result((None, []))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
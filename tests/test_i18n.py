@@ -18,6 +18,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from main.i18n import I18nManager, AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE
 
+# 所有语言包中都存在的翻译键
+KNOWN_KEYS = ("app.name", "btn.start", "settings.title")
+
 
 class TestI18nManagerBasic:
     """I18nManager 基础单元测试"""
@@ -102,6 +105,12 @@ class TestI18nManagerFormatting:
         result = i18n.get("panel.files.count")
         assert "{count}" in result
 
+    def test_format_partial_params(self):
+        """测试只提供部分参数时填入已有参数，缺少的保留占位符"""
+        i18n = I18nManager()
+        result = i18n.get("status.done", emoji="🎉", success=8)
+        assert result == "🎉 完成: 8/{total} 成功，用时 {time}s"
+
 
 class TestI18nManagerPropertyTests:
     """I18nManager 属性测试
@@ -111,8 +120,9 @@ class TestI18nManagerPropertyTests:
     """
 
     def setup_method(self):
-        """每个测试前重置单例"""
+        """每个测试前重置单例，并创建本测试所有样例共用的实例"""
         I18nManager.reset()
+        self.i18n = I18nManager()
 
     @given(st.text(min_size=1, max_size=100))
     @settings(max_examples=100)
@@ -125,14 +135,12 @@ class TestI18nManagerPropertyTests:
         For any translation key that does not exist in the current language pack,
         the I18nManager SHALL return the key itself as fallback.
         """
-        i18n = I18nManager()
         # 使用一个肯定不存在的前缀
         fake_key = f"__nonexistent_prefix__.{key}"
-        result = i18n.get(fake_key)
+        result = self.i18n.get(fake_key)
         assert result == fake_key
 
-    @given(st.sampled_from(["zh_CN", "en_US"]))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("lang_code", ["zh_CN", "en_US"])
     def test_existing_keys_return_translation(self, lang_code: str):
         """Property 1: 存在的键应返回对应翻译
         
@@ -142,14 +150,11 @@ class TestI18nManagerPropertyTests:
         For any translation key that exists in the current language pack,
         the I18nManager SHALL return the corresponding translation.
         """
-        I18nManager.reset()
-        i18n = I18nManager()
-        i18n.set_language(lang_code)
-        
+        self.i18n.set_language(lang_code)
+
         # 测试一些已知存在的键
-        known_keys = ["app.name", "btn.start", "settings.title"]
-        for key in known_keys:
-            result = i18n.get(key)
+        for key in KNOWN_KEYS:
+            result = self.i18n.get(key)
             # 结果不应该等于键本身（因为键存在）
             assert result != key
             # 结果应该是非空字符串
@@ -164,8 +169,9 @@ class TestI18nManagerFormattingProperty:
     """
 
     def setup_method(self):
-        """每个测试前重置单例"""
+        """每个测试前重置单例，并创建本测试所有样例共用的实例"""
         I18nManager.reset()
+        self.i18n = I18nManager()
 
     @given(st.integers(min_value=0, max_value=10000))
     @settings(max_examples=100)
@@ -178,8 +184,7 @@ class TestI18nManagerFormattingProperty:
         For any translation string containing placeholders, calling get(key, **kwargs)
         with the appropriate keyword arguments SHALL return a properly formatted string.
         """
-        i18n = I18nManager()
-        result = i18n.get("panel.files.count", count=count)
+        result = self.i18n.get("panel.files.count", count=count)
         assert str(count) in result
         assert "{count}" not in result
 
@@ -195,9 +200,8 @@ class TestI18nManagerFormattingProperty:
         Feature: internationalization, Property 4: String Formatting with Placeholders
         Validates: Requirements 6.1, 6.4
         """
-        i18n = I18nManager()
         time_str = f"{time:.1f}"
-        result = i18n.get("status.done", emoji="✅", success=success, total=total, time=time_str)
+        result = self.i18n.get("status.done", emoji="✅", success=success, total=total, time=time_str)
         assert str(success) in result
         assert str(total) in result
         assert "{success}" not in result
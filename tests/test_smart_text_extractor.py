@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""SmartTextExtractor 测试模块
+
+验证候选标题清理和评分逻辑，不依赖真实 PDF 文件。
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main import smart_text_extractor
+from main.smart_text_extractor import MAX_LINES_PER_PAGE, SmartTextExtractor
+
+
+class TestCleanCandidate:
+    """候选文本清理测试"""
+
+    def setup_method(self):
+        """每个测试前创建提取器"""
+        self.extractor = SmartTextExtractor()
+
+    def test_strips_parentheses(self):
+        """测试去除首尾括号"""
+        assert self.extractor._clean_candidate("(Hello World)") == "Hello World"
+
+    def test_rejects_too_short(self):
+        """测试过短文本被拒绝"""
+        assert self.extractor._clean_candidate("abc") == ""
+
+    def test_rejects_cid_only_text(self):
+        """测试仅含未映射字形占位符的文本被拒绝"""
+        assert self.extractor._clean_candidate("(cid:12)(cid:13)(cid:14)") == ""
+
+    def test_removes_cid_placeholders(self):
+        """测试移除文本中的未映射字形占位符"""
+        result = self.extractor._clean_candidate("飞行手册(cid:3)第一卷")
+        assert result == "飞行手册第一卷"
+
+    def test_rejects_text_without_letters(self):
+        """测试不含文字的文本（页码、日期）被拒绝"""
+        assert self.extractor._clean_candidate("- 12 -") == ""
+        assert self.extractor._clean_candidate("2024-01-01") == ""
+        assert self.extractor._clean_candidate("____----") == ""
+
+    def test_accepts_non_latin_letters(self):
+        """测试非拉丁文字的标题被保留"""
+        assert self.extractor._clean_candidate("ひらがなテスト") == "ひらがなテスト"
+        assert self.extractor._clean_candidate("Привет мир") == "Привет мир"
+
+    def test_strips_tool_prefix_and_extension(self):
+        """测试去除办公软件前缀和文件扩展名"""
+        result = self.extractor._clean_candidate("Microsoft Word - Flight Manual Vol 1.docx")
+        assert result == "Flight Manual Vol 1"
+        assert self.extractor._clean_candidate("A320 AFM.pdf") == "A320 AFM"
+
+    def test_rejects_default_titles(self):
+        """测试拒绝软件生成的默认标题"""
+        assert self.extractor._clean_candidate("Untitled") == ""
+        assert self.extractor._clean_candidate("Microsoft Word - Document1.docx") == ""
+        assert self.extractor._clean_candidate("untitled-3.indd") == ""
+        assert self.extractor._clean_candidate("Document Control Manual") == "Document Control Manual"
+
+
+class TestExtractTitle:
+    """标题提取入口测试"""
+
+    def setup_method(self):
+        """每个测试前创建提取器"""
+        self.extractor = SmartTextExtractor()
+
+    def test_non_pdf_skips_parsing(self, tmp_path, monkeypatch):
+        """测试没有 PDF 文件头的文件不交给解析库"""
+        def fail(pdf_path):
+            raise AssertionError("不应解析")
+
+        monkeypatch.setattr(self.extractor, "_extract_from_metadata", fail)
+        path = tmp_path / "fake.pdf"
+        path.write_bytes(b"<html>not a pdf</html>")
+        assert self.extractor.extract_title(path) is None
+        assert self.extractor.extract_title(tmp_path / "missing.pdf") is None
+
+    def test_header_after_leading_bytes(self, tmp_path):
+        """测试文件头前有少量多余字节时仍视为 PDF"""
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"\r\n\x00junk%PDF-1.7\n")
+        assert self.extractor._has_pdf_header(path)
+        path.write_bytes(b"x" * 2000 + b"%PDF-1.7")
+        assert not self.extractor._has_pdf_header(path)
+
+
+class TestScoreLine:
+    """标题评分测试"""
+
+    def setup_method(self):
+        """每个测试前创建提取器"""
+        self.extractor = SmartTextExtractor()
+
+    def test_keyword_bonus(self):
+        """测试包含关键词的行得分更高"""
+        plain = self.extractor._score_line("Normal Procedures")
+        assert self.extractor._score_line("Flight Manual Pro") == pytest.approx(plain * 1.3)
+        assert self.extractor._score_line("空客飞行手册") > self.extractor._score_line("空客飞行资料")
+
+    def test_character_type_factors(self):
+        """测试中文、英文字母和数字分别加分"""
+        assert self.extractor._score_line("abcdefgh") == pytest.approx(1.1)
+        assert self.extractor._score_line("机型手册资料") == pytest.approx(1.2)
+        assert self.extractor._score_line("A320 机型资料") == pytest.approx(1.2 * 1.1 * 1.05)
+        assert self.extractor._score_line("Привет мир") == pytest.approx(1.0)
+
+
+class TestExtractFromFirstPages:
+    """首页标题提取测试"""
+
+    def setup_method(self):
+        """每个测试前创建提取器"""
+        self.extractor = SmartTextExtractor()
+
+    def _fake_pages(self, pages, consumed):
+        """返回逐页产出无字号文本行并记录已读取页数的替身"""
+        def iter_page_lines(pdf_path, max_pages):
+            for text in pages:
+                consumed.append(text)
+                yield ((line, 0.0) for line in text.splitlines() if line)
+        return iter_page_lines
+
+    def test_stops_after_high_confidence_page(self, monkeypatch):
+        """测试首页已有高置信度标题时不再读取第二页"""
+        consumed = []
+        pages = ["A320 飞行手册 Flight Manual\n- 1 -", "Other Title Page"]
+        monkeypatch.setattr(
+            self.extractor, "_iter_page_lines", self._fake_pages(pages, consumed)
+        )
+        result = self.extractor._extract_from_first_pages(Path("doc.pdf"))
+        assert result == "A320 飞行手册 Flight Manual"
+        assert len(consumed) == 1
+
+    def test_reads_next_page_when_unsure(self, monkeypatch):
+        """测试首页没有高置信度标题时继续读取下一页"""
+        consumed = []
+        pages = ["Contents\n- 1 -", "操作程序 Operations Manual"]
+        monkeypatch.setattr(
+            self.extractor, "_iter_page_lines", self._fake_pages(pages, consumed)
+        )
+        result = self.extractor._extract_from_first_pages(Path("doc.pdf"))
+        assert result == "操作程序 Operations Manual"
+        assert len(consumed) == 2
+
+    def test_only_top_lines_scored(self, monkeypatch):
+        """测试每页只分析前若干个非空行"""
+        filler = "\n\n".join(f"Section {i}" for i in range(MAX_LINES_PER_PAGE))
+        pages = [filler + "\n飞行手册 Flight Manual"]
+        monkeypatch.setattr(
+            self.extractor, "_iter_page_lines", self._fake_pages(pages, [])
+        )
+        result = self.extractor._extract_from_first_pages(Path("doc.pdf"))
+        assert result == "Section 0"
+
+    def test_blank_lines_not_counted(self, tmp_path, monkeypatch):
+        """测试只含空白的行不计入每页的行数上限"""
+        padding = "   \n\t\n" * MAX_LINES_PER_PAGE
+        page = SimpleNamespace(extract_text=lambda: padding + "  飞行手册 Flight Manual  \n")
+        fake = SimpleNamespace(
+            PdfReader=lambda stream, strict=False: SimpleNamespace(pages=[page])
+        )
+        monkeypatch.setattr(smart_text_extractor, "_optional_import", {"pypdf": fake}.get)
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        assert self.extractor._extract_from_first_pages(pdf) == "飞行手册 Flight Manual"
+
+    def test_prefers_largest_font(self, monkeypatch):
+        """测试有字号信息时大字号的行优先于含关键词的正文行"""
+        lines = [("Refer to the Flight Manual", 10.0), ("A320 Operations", 24.0)]
+        monkeypatch.setattr(
+            self.extractor, "_iter_page_lines", lambda pdf_path, max_pages: [iter(lines)]
+        )
+        result = self.extractor._extract_from_first_pages(Path("doc.pdf"))
+        assert result == "A320 Operations"
+
+    def test_font_weight_compared_across_pages(self, monkeypatch):
+        """测试字号按所有已分析页面的最大字号加权，第二页的正文不会压过首页标题"""
+        pages = [
+            [("A320 Operations", 24.0), ("Prepared by Airbus", 10.0)],
+            [("Refer to the Flight Manual", 10.0)],
+        ]
+        monkeypatch.setattr(
+            self.extractor, "_iter_page_lines",
+            lambda pdf_path, max_pages: (iter(page) for page in pages),
+        )
+        result = self.extractor._extract_from_first_pages(Path("doc.pdf"))
+        assert result == "A320 Operations"
+
+    def test_pdfium_page_texts(self, monkeypatch):
+        """测试未安装 PyMuPDF 时用 pypdfium2 读取前几页文本并关闭文档"""
+        closed = []
+
+        def make_page(text):
+            textpage = SimpleNamespace(get_text_range=lambda: text, close=lambda: None)
+            return SimpleNamespace(get_textpage=lambda: textpage, close=lambda: None)
+
+        class FakeDocument:
+            def __init__(self, path):
+                self.pages = [make_page("第一页\r\n标题"), make_page("第二页"), make_page("第三页")]
+
+            def __len__(self):
+                return len(self.pages)
+
+            def __getitem__(self, index):
+                return self.pages[index]
+
+            def close(self):
+                closed.append(True)
+
+        fake = SimpleNamespace(PdfDocument=FakeDocument)
+        monkeypatch.setattr(smart_text_extractor, "_optional_import", {"pypdfium2": fake}.get)
+        texts = list(self.extractor._iter_page_texts(Path("doc.pdf"), 2))
+        assert texts == ["第一页\r\n标题", "第二页"]
+        assert closed == [True]
+
+    def test_pypdf_page_texts(self, tmp_path, monkeypatch):
+        """测试未安装 C 引擎时用 pypdf 读取前几页文本"""
+        pages = [SimpleNamespace(extract_text=lambda t=t: t) for t in ("标题页", None, "第三页")]
+        reader = SimpleNamespace(pages=pages)
+        fake = SimpleNamespace(PdfReader=lambda stream, strict=False: reader)
+        monkeypatch.setattr(smart_text_extractor, "_optional_import", {"pypdf": fake}.get)
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        assert list(self.extractor._iter_page_texts(pdf, 2)) == ["标题页", ""]
+
+    def test_dict_page_lines(self):
+        """测试展开 PyMuPDF 结构化结果，取行内最大字号"""
+        data = {"blocks": [
+            {"type": 1},
+            {"lines": [
+                {"spans": [{"text": "A320 ", "size": 20.0}, {"text": "AFM", "size": 18.0}]},
+                {"spans": []},
+                {"spans": [{"text": "  ", "size": 30.0}]},
+            ]},
+        ]}
+        assert list(self.extractor._dict_page_lines(data)) == [("A320 AFM", 20.0)]
+
+
+class TestExtractFromMetadata:
+    """元数据标题提取测试"""
+
+    def setup_method(self):
+        """每个测试前创建提取器"""
+        self.extractor = SmartTextExtractor()
+
+    def _fake_pdfium(self, metadata=None, error=None):
+        """创建 pypdfium2 替身模块"""
+        def open_document(path):
+            if error is not None:
+                raise error
+            return SimpleNamespace(
+                get_metadata_dict=lambda: metadata, close=lambda: None
+            )
+        return SimpleNamespace(PdfDocument=open_document)
+
+    def _fake_pypdf(self, title):
+        """创建 pypdf 替身模块"""
+        reader = SimpleNamespace(metadata=SimpleNamespace(title=title))
+        return SimpleNamespace(PdfReader=lambda stream, strict=False: reader)
+
+    def _use_modules(self, monkeypatch, modules):
+        """替换可选依赖的导入结果"""
+        monkeypatch.setattr(smart_text_extractor, "_optional_import", modules.get)
+
+    def test_uses_pdfium_title(self, monkeypatch):
+        """测试安装 pypdfium2 时使用其读取的标题"""
+        self._use_modules(monkeypatch, {
+            "pypdfium2": self._fake_pdfium({"Title": " 飞行手册第一卷 "}),
+            "pypdf": self._fake_pypdf("pypdf title"),
+        })
+        assert self.extractor._extract_from_metadata(Path("doc.pdf")) == "飞行手册第一卷"
+
+    def test_pdfium_without_title(self, monkeypatch):
+        """测试 pypdfium2 读不到标题时不再用 pypdf 重复解析"""
+        self._use_modules(monkeypatch, {
+            "pypdfium2": self._fake_pdfium({"Producer": "x"}),
+            "pypdf": self._fake_pypdf("pypdf title"),
+        })
+        assert self.extractor._extract_from_metadata(Path("doc.pdf")) is None
+
+    def test_falls_back_to_pypdf(self, tmp_path, monkeypatch):
+        """测试 pypdfium2 打开失败时退回 pypdf"""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        self._use_modules(monkeypatch, {
+            "pypdfium2": self._fake_pdfium(error=RuntimeError("broken")),
+            "pypdf": self._fake_pypdf("Operations Manual"),
+        })
+        assert self.extractor._extract_from_metadata(pdf) == "Operations Manual"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""TitleCache 测试模块
+
+验证标题缓存的键生成、读写和持久化。
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main.smart_text_extractor import ExtractedText
+from main import title_cache
+from main.title_cache import TitleCache
+from main.utils import json_dumps
+
+
+class TestTitleCache:
+    """标题缓存测试"""
+
+    def setup_method(self):
+        """每个测试前准备示例结果"""
+        self.extracted = ExtractedText(
+            text="飞行手册第一卷", confidence=0.9, strategy="metadata"
+        )
+
+    def test_make_key_missing_file(self, tmp_path):
+        """测试文件不存在时返回 None"""
+        assert TitleCache.make_key(tmp_path / "missing.pdf") is None
+
+    def test_key_changes_with_content(self, tmp_path):
+        """测试文件内容变化后缓存键随之变化"""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        key = TitleCache.make_key(pdf)
+        pdf.write_bytes(b"%PDF-1.4 changed")
+        assert TitleCache.make_key(pdf) != key
+
+    def test_key_independent_of_path(self, tmp_path):
+        """测试重命名或复制后的文件得到相同的缓存键"""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4" + b"x" * 200_000)
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf.read_bytes())
+        key = TitleCache.make_key(pdf)
+        assert TitleCache.make_key(copy) == key
+        renamed = pdf.rename(tmp_path / "renamed.pdf")
+        assert TitleCache.make_key(renamed) == key
+
+    def test_key_changes_with_tail(self, tmp_path):
+        """测试文件尾部变化（如增量更新）后缓存键变化"""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4" + b"x" * 200_000 + b"%%EOF")
+        key = TitleCache.make_key(pdf)
+        pdf.write_bytes(b"%PDF-1.4" + b"x" * 200_000 + b"%%EOG")
+        assert TitleCache.make_key(pdf) != key
+
+    def test_put_and_get(self, tmp_path):
+        """测试写入后可以读出相同结果"""
+        cache = TitleCache(tmp_path / "cache.json")
+        cache.put("key", self.extracted)
+        assert cache.get("key") == self.extracted
+        assert cache.get("other") is None
+        assert cache.get(None) is None
+
+    def test_contains(self, tmp_path):
+        """测试成员判断与查询结果一致"""
+        cache = TitleCache(tmp_path / "cache.json")
+        cache.put("key", self.extracted)
+        assert "key" in cache
+        assert "other" not in cache
+        assert None not in cache
+
+    def test_persists_across_instances(self, tmp_path):
+        """测试保存后新实例可以读取"""
+        cache_file = tmp_path / "sub" / "cache.json"
+        cache = TitleCache(cache_file)
+        cache.put("key", self.extracted)
+        assert cache.save()
+        assert TitleCache(cache_file).get("key") == self.extracted
+
+    def test_save_replaces_file(self, tmp_path):
+        """测试保存通过临时文件替换，目录中不留下临时文件"""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_bytes(b"old")
+        cache = TitleCache(cache_file)
+        cache.put("key", self.extracted)
+        assert cache.save()
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+        assert TitleCache(cache_file).get("key") == self.extracted
+
+    def test_failed_save_keeps_old_file(self, tmp_path, monkeypatch):
+        """测试写入失败时原缓存文件保持不变，临时文件被清理"""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_bytes(b"old")
+        cache = TitleCache(cache_file)
+        cache.put("key", self.extracted)
+        monkeypatch.setattr(title_cache, "json_dumps", _raise_type_error)
+        assert not cache.save()
+        assert cache_file.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        """测试损坏的缓存文件被忽略"""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_bytes(b"not json")
+        assert TitleCache(cache_file).get("key") is None
+
+    def test_version_mismatch_discarded(self, tmp_path, monkeypatch):
+        """测试提取规则版本变化后旧缓存整体失效"""
+        cache_file = tmp_path / "cache.json"
+        cache = TitleCache(cache_file)
+        cache.put("key", self.extracted)
+        assert cache.save()
+        monkeypatch.setattr(title_cache, "CACHE_VERSION", title_cache.CACHE_VERSION + 1)
+        assert "key" not in TitleCache(cache_file)
+
+    def test_unversioned_file_discarded(self, tmp_path):
+        """测试没有版本信息的旧格式缓存文件被丢弃"""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_bytes(
+            json_dumps({"key": {"text": "旧标题", "confidence": 0.9, "strategy": "metadata"}})
+        )
+        assert "key" not in TitleCache(cache_file)
+
+
+def _raise_type_error(obj):
+    """模拟序列化失败"""
+    raise TypeError("not serializable")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])